@@ -0,0 +1,32 @@
+from benchmarks.common import init, measure
+
+import pygame
+
+from engine.assets import assets
+from engine.level import Level
+from entities.player import Player
+
+
+def load_time(number: int, player: Player) -> float:
+    return measure(lambda: Level(number, player), 1)
+
+
+def main() -> None:
+    init()
+
+    player = Player(-100, -100)
+
+    for number in (1, 2, 3):
+        assets.clear()
+        cold = load_time(number, player)
+        warm = load_time(number, player)
+
+        print(
+            f"level {number}: cold {cold:.2f} ms, warm {warm:.2f} ms, {assets.stats()}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from benchmarks.common import generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from entities.player import Player
+
+
+def main() -> None:
+    screen = init()
+    background = pygame.Surface(screen.get_size()).convert()
+
+    print(f"{'map':>9} {'static ms':>10} {'scroll ms':>10} {'chunks':>7}")
+    for size in (20, 100, 300):
+        player = Player(0, 0)
+        level = Level(1, player, generate_map(size, size, 50))
+        level.set_background(background)
+        level.draw(screen)
+
+        static = measure(lambda: level.draw(screen), 200)
+
+        width, height = level.size
+        frames = 600
+
+        positions = iter(range(frames))
+
+        def scroll_frame() -> None:
+            frame = next(positions)
+            player.rect.center = (
+                width * frame // frames,
+                height * frame // frames,
+            )
+            level.draw(screen)
+
+        scroll = measure(scroll_frame, frames)
+
+        print(f"{size:>9} {static:>10.3f} {scroll:>10.3f} {level.layer.renders:>7}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
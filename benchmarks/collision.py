@@ -0,0 +1,49 @@
+import random
+
+from benchmarks.common import Wall, generate_map, init, legacy_walls, measure
+
+import pygame
+
+from engine.level import Level
+from entities.player import Player
+
+
+def scan_collisions(walls: list[Wall], rects: list[pygame.Rect]) -> None:
+    for rect in rects:
+        for wall in walls:
+            if rect.colliderect(wall.rect):
+                break
+
+
+def grid_collisions(level: Level, rects: list[pygame.Rect]) -> None:
+    for rect in rects:
+        level.walls.collides(rect)
+
+
+def main() -> None:
+    init()
+
+    print(f"{'map':>9} {'ghosts':>6} {'scan ms':>9} {'grid ms':>9} {'update ms':>10}")
+    for size, ghosts in [(20, 4), (50, 4), (50, 50), (100, 50), (100, 200)]:
+        random.seed(0)
+        level = Level(1, Player(0, 0), generate_map(size, size, ghosts))
+
+        movers = [level.player, *level.ghosts.sprites()]
+        rects = [mover.rect.move(3, 0) for mover in movers]
+
+        walls = legacy_walls(level.walls)
+
+        scan = measure(lambda: scan_collisions(walls, rects), 5)
+        grid = measure(lambda: grid_collisions(level, rects), 5)
+        update = measure(level.update, 20)
+
+        print(
+            f"{size:>4}x{size:<4} {ghosts:>6} {scan:>9.3f} {grid:>9.3f} "
+            f"{update:>10.3f}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
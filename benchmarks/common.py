@@ -0,0 +1,88 @@
+import gc
+import os
+import random
+import sys
+import time
+from typing import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)
+
+import pygame  # noqa: E402
+
+from engine.assets import assets  # noqa: E402
+from engine.grid import TILE_SIZE, WallGrid  # noqa: E402
+from entities.entity import Entity  # noqa: E402
+from entities.ghost import Ghost  # noqa: E402
+
+
+class Wall(Entity):
+    __slots__ = ()
+
+    def __init__(self, x: int, y: int, *groups) -> None:
+        super().__init__(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, "wall", *groups)
+        self.set_image(assets.image("assets/images/wall.png", (TILE_SIZE, TILE_SIZE)))
+
+
+class ChasingGhost(Ghost):
+    def is_player_is_sight(self, *_) -> bool:
+        return True
+
+
+def init(size: tuple[int, int] = (800, 800)) -> pygame.Surface:
+    pygame.init()
+    pygame.mixer.init()
+    return pygame.display.set_mode(size)
+
+
+def generate_map(width: int, height: int, ghosts: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            border = x in (0, width - 1) or y in (0, height - 1)
+            pillar = x % 4 == 2 and y % 4 == 2
+            row.append("=" if border or pillar else "*")
+        rows.append(row)
+
+    rows[1][1] = "P"
+
+    free = [
+        (x, y)
+        for y in range(1, height - 1)
+        for x in range(1, width - 1)
+        if rows[y][x] == "*"
+    ]
+    for x, y in rng.sample(free, min(ghosts, len(free))):
+        rows[y][x] = "G"
+
+    return ["".join(row) for row in rows]
+
+
+def legacy_walls(walls: WallGrid) -> list[Wall]:
+    return [
+        Wall(x, y)
+        for y in range(walls.rows)
+        for x in range(walls.columns)
+        if walls.is_wall(x, y)
+    ]
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) * 1000 / repeat
+    finally:
+        gc.enable()
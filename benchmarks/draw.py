@@ -0,0 +1,47 @@
+from benchmarks.common import generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from engine.render import RenderQueue
+from entities.player import Player
+
+
+def sprite_draw(level: Level, screen: pygame.Surface) -> None:
+    offset = level.camera.offset
+
+    level.layer.draw(screen, level.camera.view)
+
+    for ghost in level.ghosts.sprites():
+        ghost.draw(screen, offset)
+
+    level.player.draw(screen, offset)
+
+
+def main() -> None:
+    screen = init()
+    background = pygame.Surface(screen.get_size()).convert()
+
+    queue = RenderQueue()
+
+    print(f"{'ghosts':>7} {'sprites ms':>11} {'queue ms':>9} {'blits':>6}")
+    for ghosts in (4, 100, 250, 400):
+        level = Level(1, Player(0, 0), generate_map(24, 24, ghosts))
+        level.set_background(background)
+        level.draw(screen)
+
+        sprites = measure(lambda: sprite_draw(level, screen), 500)
+
+        def queued() -> None:
+            level.draw(screen, 1.0, queue)
+            queue.flush(screen)
+
+        batched = measure(queued, 500)
+
+        print(f"{ghosts:>7} {sprites:>11.3f} {batched:>9.3f} {queue.items:>6}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import gc
+import tracemalloc
+from typing import Callable
+
+from benchmarks.common import Wall, generate_map
+
+import pygame
+
+from engine.assets import assets
+from engine.grid import TILE_SIZE
+from engine.level import Level
+from entities.ghost import Ghost
+from entities.player import Player
+
+COUNT = 10000
+
+
+class LegacyEntity(pygame.sprite.Sprite):
+    def __init__(self, x: int, y: int, size: int, image_path: str, tag: str) -> None:
+        super().__init__()
+
+        self.size = size
+        self.tag = tag
+
+        self.image = assets.image(image_path, (size, size)).copy()
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+class LegacyGhost(LegacyEntity):
+    def __init__(self, x: int, y: int, speed: int) -> None:
+        super().__init__(x * 40, y * 40, 32, "assets/images/ghost.png", "ghost")
+
+        self.speed = speed
+        self.direction = pygame.math.Vector2(0, 0)
+        self.previous = self.rect.topleft
+
+
+def legacy_wall(x: int, y: int) -> LegacyEntity:
+    return LegacyEntity(
+        x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, "assets/images/wall.png", "wall"
+    )
+
+
+def traced(function: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    result = function()
+
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del result
+
+    return size
+
+
+def per_entity(create: Callable[[int, int], pygame.sprite.Sprite]) -> float:
+    entities: list[pygame.sprite.Sprite] = []
+
+    size = traced(
+        lambda: entities.extend(create(i % 300, i // 300) for i in range(COUNT))
+    )
+    images = {id(entity.image): entity.image for entity in entities}
+    pixels = sum(image.get_pitch() * image.get_height() for image in images.values())
+
+    return (size + pixels) / COUNT
+
+
+def main() -> None:
+    # tracemalloc crashes alongside the mixer thread, so only the display is set up.
+    pygame.display.init()
+    pygame.display.set_mode((800, 800))
+
+    print(f"{'entity':>6} {'legacy B':>9} {'current B':>10}")
+    for name, legacy, current in (
+        ("wall", legacy_wall, Wall),
+        ("ghost", lambda x, y: LegacyGhost(x, y, 2), lambda x, y: Ghost(x, y, 2)),
+    ):
+        legacy(0, 0)
+        current(0, 0)
+
+        print(f"{name:>6} {per_entity(legacy):>9.0f} {per_entity(current):>10.0f}")
+
+    player = Player(0, 0)
+    for size, count in ((100, 100), (300, 500)):
+        data = generate_map(size, size, count)
+        level = traced(lambda: Level(1, player, data))
+
+        print(f"{size}x{size}-{count} level {level / 2**20:.1f} MiB")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
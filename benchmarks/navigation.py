@@ -0,0 +1,68 @@
+import itertools
+import random
+
+from benchmarks.common import ChasingGhost, generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from entities.player import Player
+
+
+def decision_time(level: Level, repeat: int) -> float:
+    ghosts = level.ghosts.sprites()
+
+    def decide() -> None:
+        for ghost in ghosts:
+            ghost.follow(level.navigation, level.player, level)
+
+    return measure(decide, repeat) * 1000 / len(ghosts)
+
+
+def main() -> None:
+    init()
+
+    print(
+        f"{'ghosts':>6} {'update ms':>10} {'decision us':>12} "
+        f"{'rebuild ms':>11} {'rebuilds':>9}"
+    )
+    for ghosts in (4, 50, 500):
+        random.seed(0)
+
+        player = Player(0, 0)
+        level = Level(1, player, generate_map(60, 60, ghosts))
+
+        for ghost in level.ghosts.sprites():
+            ghost.__class__ = ChasingGhost
+
+        keys = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+        frame = 0
+
+        def update() -> None:
+            nonlocal frame
+            if frame % 30 == 0:
+                player.handle_keydown(random.choice(keys))
+            frame += 1
+            level.update()
+
+        update_ms = measure(update, 300)
+        decision_us = decision_time(level, 20)
+
+        targets = itertools.cycle([(1, 1), (1, 2)])
+
+        def rebuild() -> None:
+            level.navigation.update(*next(targets))
+            level.navigation.direction(1, 1)
+
+        rebuild_ms = measure(rebuild, 50)
+
+        print(
+            f"{ghosts:>6} {update_ms:>10.3f} {decision_us:>12.2f} "
+            f"{rebuild_ms:>11.3f} {level.navigation.rebuilds:>9}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import tracemalloc
+
+from benchmarks.common import generate_map, init, measure
+
+import pygame
+
+from engine.assets import assets
+from engine.grid import TILE_SIZE
+from engine.pellets import PelletGrid
+from entities.entity import Entity
+from entities.food import FOOD_KINDS, FOOD_TILES
+
+
+def sprite_pellets(data: list[str]) -> pygame.sprite.Group:
+    group = pygame.sprite.Group()
+
+    for y, line in enumerate(data):
+        for x, tile in enumerate(line):
+            if tile == "*":
+                pellet = Entity(
+                    x * TILE_SIZE + 16, y * TILE_SIZE + 16, 16, "food", group
+                )
+                pellet.set_image(assets.circle(16, "yellow"))
+
+    return group
+
+
+def grid_pellets(data: list[str]) -> PelletGrid:
+    grid = PelletGrid(len(data[0]), len(data), FOOD_KINDS, TILE_SIZE)
+
+    for y, line in enumerate(data):
+        for x, tile in enumerate(line):
+            if tile == "*":
+                grid.add(x, y, FOOD_TILES[tile], 1)
+
+    return grid
+
+
+def traced(build, data: list[str]) -> tuple[object, int]:
+    tracemalloc.start()
+    result = build(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, size
+
+
+def main() -> None:
+    init()
+
+    probe = pygame.sprite.Sprite()
+    probe.rect = pygame.Rect(TILE_SIZE + 5, TILE_SIZE + 5, 32, 32)
+
+    print(
+        f"{'map':>9} {'pellets':>8} {'sprite KiB':>11} {'grid KiB':>9} "
+        f"{'sprite eat us':>14} {'grid eat us':>12}"
+    )
+    for size in (20, 100, 300):
+        data = generate_map(size, size, 0)
+
+        group, sprite_memory = traced(sprite_pellets, data)
+        grid, grid_memory = traced(grid_pellets, data)
+        pellets = len(grid)
+
+        sprite_eat = measure(
+            lambda: pygame.sprite.spritecollide(probe, group, False), 20
+        )
+        grid_eat = measure(lambda: grid.eat(probe.rect), 20)
+
+        print(
+            f"{size:>4}x{size:<4} {pellets:>8} {sprite_memory / 1024:>11.1f} "
+            f"{grid_memory / 1024:>9.1f} {sprite_eat * 1000:>14.1f} "
+            f"{grid_eat * 1000:>12.1f}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from benchmarks.common import Wall, generate_map, init, legacy_walls, measure
+
+import pygame
+
+from engine.level import Level
+from entities.player import Player
+
+
+def sprite_draw(level: Level, walls: list[Wall], screen: pygame.Surface) -> None:
+    for wall in walls:
+        wall.draw(screen)
+
+    for ghost in level.ghosts.sprites():
+        ghost.draw(screen)
+
+    for x, y, kind in level.pellets:
+        screen.blit(kind.image(), kind.rect(x, y))
+
+    level.player.draw(screen)
+
+
+def main() -> None:
+    screen = init()
+    background = pygame.Surface(screen.get_size()).convert()
+
+    levels = {f"level {number}": None for number in (1, 2, 3)}
+    levels["100x100"] = generate_map(100, 100, 50)
+
+    print(f"{'map':>9} {'sprites ms':>11} {'layer ms':>9}")
+    for name, data in levels.items():
+        number = int(name.split()[1]) if data is None else 1
+        level = Level(number, Player(0, 0), data)
+        level.set_background(background)
+        level.draw(screen)
+        walls = legacy_walls(level.walls)
+
+        sprites = measure(lambda: sprite_draw(level, walls, screen), 200)
+        layer = measure(lambda: level.draw(screen), 200)
+
+        print(f"{name:>9} {sprites:>11.3f} {layer:>9.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import itertools
+
+from benchmarks.common import init, measure
+
+import pygame
+
+from engine.level import Level
+from entities.player import Player
+
+
+class LegacyPlayer(Player):
+    def respawn(self, x: int, y: int) -> None:
+        score = self.score()
+
+        Player.__init__(self, x, y)
+
+        self._Player__score = score
+
+        self.rect.topleft = (x, y)
+
+
+def timing(player: Player, repeat: int) -> tuple[float, float]:
+    respawn = measure(lambda: player.respawn(45, 45), repeat)
+
+    numbers = itertools.cycle((1, 2, 3))
+    load = measure(lambda: Level(next(numbers), player), repeat // 30 * 3)
+
+    return respawn, load
+
+
+def main() -> None:
+    init()
+
+    print(f"{'player':>8} {'respawn ms':>11} {'level load ms':>14}")
+    for name, player in (("legacy", LegacyPlayer(0, 0)), ("reset", Player(0, 0))):
+        respawn, load = timing(player, 300)
+        print(f"{name:>8} {respawn:>11.3f} {load:>14.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
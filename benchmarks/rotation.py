@@ -0,0 +1,46 @@
+from benchmarks.common import init, measure
+
+import pygame
+
+from entities.player import Player
+
+
+class LegacyPlayer(Player):
+    def rotate(self) -> pygame.Surface:
+        angle = self.direction.angle_to(pygame.math.Vector2(1, 0))
+        return pygame.transform.rotate(self.image, angle)
+
+
+def profile(player: Player, frames: int) -> tuple[float, float]:
+    rotate = pygame.transform.rotate
+    calls = 0
+
+    def counting_rotate(*args) -> pygame.Surface:
+        nonlocal calls
+        calls += 1
+        return rotate(*args)
+
+    pygame.transform.rotate = counting_rotate
+    player.change_direction(1, 0)
+
+    try:
+        ms = measure(player.animate, frames)
+    finally:
+        pygame.transform.rotate = rotate
+
+    return calls / frames, ms
+
+
+def main() -> None:
+    init()
+
+    print(f"{'player':>8} {'surfaces/frame':>15} {'ms/frame':>9}")
+    for name, player in (("legacy", LegacyPlayer(0, 0)), ("cached", Player(0, 0))):
+        surfaces, ms = profile(player, 6000)
+        print(f"{name:>8} {surfaces:>15.2f} {ms:>9.4f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import random
+
+from benchmarks.common import ChasingGhost, generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from engine.scheduler import ai_scheduler
+from entities.player import Player
+
+
+def run(ghosts: int, budget: float | None, frames: int) -> tuple[float, float, float]:
+    random.seed(0)
+
+    player = Player(0, 0)
+    level = Level(1, player, generate_map(80, 80, ghosts))
+
+    for ghost in level.ghosts.sprites():
+        ghost.__class__ = ChasingGhost
+
+    ai_scheduler.set_budget(budget)
+    ai_scheduler.reset()
+    plans = ai_scheduler.stats()["plans"]
+
+    keys = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+    times = []
+
+    for frame in range(frames):
+        if frame % 30 == 0:
+            player.handle_keydown(random.choice(keys))
+
+        times.append(measure(level.update, 1))
+
+    plans = (ai_scheduler.stats()["plans"] - plans) / frames
+
+    return sum(times) / frames, max(times), plans
+
+
+def main() -> None:
+    init()
+
+    print(
+        f"{'ghosts':>6} {'budget us':>10} {'mean ms':>8} {'max ms':>8} "
+        f"{'plans/frame':>12} {'stale frames':>13}"
+    )
+    for ghosts in (50, 500, 2000):
+        for budget in (None, 1000, 250):
+            mean_ms, max_ms, plans = run(ghosts, budget, 120)
+            print(
+                f"{ghosts:>6} {str(budget):>10} {mean_ms:>8.3f} {max_ms:>8.3f} "
+                f"{plans:>12.1f} {ghosts / plans:>13.1f}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
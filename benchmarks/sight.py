@@ -0,0 +1,43 @@
+import random
+
+from benchmarks.common import generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from engine.sight import SightIndex
+from entities.player import Player
+
+
+def query_time(level: Level, use_index: bool, repeat: int) -> float:
+    ghosts = level.ghosts.sprites()
+    group = level if use_index else None
+    player = level.player
+
+    def query() -> None:
+        for ghost in ghosts:
+            ghost.is_player_is_sight(player, group)
+
+    return measure(query, repeat) * 1000 / len(ghosts)
+
+
+def main() -> None:
+    init()
+
+    print(f"{'map':>9} {'rect us':>8} {'index us':>9} {'build ms':>9}")
+    for size in (20, 100, 300):
+        random.seed(0)
+        level = Level(1, Player(0, 0), generate_map(size, size, 50))
+
+        build = measure(lambda: SightIndex(level.walls), 1)
+
+        rect = query_time(level, False, 200)
+        index = query_time(level, True, 200)
+
+        print(f"{size:>4}x{size:<4} {rect:>8.3f} {index:>9.3f} {build:>9.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
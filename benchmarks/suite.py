@@ -0,0 +1,171 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from benchmarks.common import ROOT, generate_map, init, measure
+
+import pygame
+
+from engine.level import Level, LevelLayout
+from entities.player import Player
+
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+CASES = [
+    {"name": "20x20-4", "size": 20, "ghosts": 4, "frames": 300, "draw": True},
+    {"name": "100x100-4", "size": 100, "ghosts": 4, "frames": 200, "draw": True},
+    {"name": "100x100-100", "size": 100, "ghosts": 100, "frames": 200, "draw": True},
+    {"name": "300x300-500", "size": 300, "ghosts": 500, "frames": 60, "draw": True},
+]
+
+SLACK = 0.1
+REPEATS = 5
+
+KEYS = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+
+def load(directory: str, player: Player) -> Level:
+    level, steps = Level.staged(1, player, LevelLayout.read(1, directory))
+    for _ in steps:
+        pass
+    level.spawn_player()
+
+    return level
+
+
+def per_frame(frames: int, step: Callable[[int], None]) -> float:
+    numbers = iter(range(frames))
+
+    return min(
+        measure(lambda: step(next(numbers)), frames // REPEATS) for _ in range(REPEATS)
+    )
+
+
+def peak_memory() -> float | None:
+    if resource is None:
+        return None
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_case(case: dict) -> dict[str, float]:
+    screen = init()
+
+    random.seed(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "1.txt"), "w") as file:
+            file.write(
+                "\n".join(generate_map(case["size"], case["size"], case["ghosts"]))
+            )
+
+        player = Player(0, 0)
+
+        level = load(directory, player)
+
+        load_ms = min(
+            measure(lambda: load(directory, player), 1) for _ in range(REPEATS)
+        )
+
+    def update(frame: int) -> None:
+        if frame % 30 == 0:
+            player.handle_keydown(random.choice(KEYS))
+        level.update()
+
+    update_ms = per_frame(case["frames"], update)
+
+    draw_ms = None
+    if case["draw"]:
+        level.set_background(pygame.Surface(screen.get_size()).convert())
+        level.draw(screen)
+
+        draw_ms = per_frame(case["frames"], lambda _: level.draw(screen))
+
+    pygame.quit()
+
+    return {
+        "load_ms": load_ms,
+        "update_ms": update_ms,
+        "draw_ms": draw_ms,
+        "peak_mib": peak_memory(),
+    }
+
+
+def run_isolated(case: dict) -> dict[str, float]:
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_case, case).result()
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    regressions = []
+
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(name, {}).get(metric)
+            if value is None or expected is None:
+                continue
+
+            if value > expected * tolerance + SLACK:
+                regressions.append(
+                    f"{name} {metric}: {value:.3f} > {expected:.3f} x {tolerance} + {SLACK}"
+                )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pacman benchmark suite")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.3)
+    parser.add_argument("--case", action="append", help="run only the named case")
+    args = parser.parse_args()
+
+    results = {}
+    print(
+        f"{'case':>12} {'load ms':>9} {'update ms':>10} {'draw ms':>8} {'peak MiB':>9}"
+    )
+    for case in CASES:
+        if args.case and case["name"] not in args.case:
+            continue
+
+        metrics = results[case["name"]] = run_isolated(case)
+
+        draw = "-" if metrics["draw_ms"] is None else f"{metrics['draw_ms']:.3f}"
+        peak = "-" if metrics["peak_mib"] is None else f"{metrics['peak_mib']:.0f}"
+        print(
+            f"{case['name']:>12} {metrics['load_ms']:>9.1f} "
+            f"{metrics['update_ms']:>10.3f} {draw:>8} {peak:>9}"
+        )
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --update-baseline")
+        return 0
+
+    with open(args.baseline, "r") as file:
+        regressions = compare(results, json.load(file), args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
@@ -0,0 +1,40 @@
+from benchmarks.common import init, measure
+
+import pygame
+
+from engine.ui.menus import BaseMenu, MenuOption
+from engine.ui.text import text_cache
+from engine.ui.ui import UI
+
+
+def main() -> None:
+    screen = init()
+
+    font = pygame.font.Font(None, 36)
+    ui = UI()
+
+    menu = BaseMenu(font, {}, "Menu")
+    for label in ("Play", "Settings", "Records", "Quit"):
+        menu.add_option(MenuOption(label, lambda: None))
+
+    cases = {
+        "hud": lambda: ui.display(screen, font, 1234, 3, 2),
+        "menu": lambda: menu.draw(screen),
+        "render": lambda: font.render("Score: 1234", True, "white"),
+        "lookup": lambda: text_cache.render(font, "Score: 1234", "white"),
+    }
+
+    for name, case in cases.items():
+        text_cache.clear()
+        elapsed = measure(case, 1000)
+
+        print(
+            f"{name}: {elapsed * 1000:.1f} us/frame, "
+            f"hit rate {text_cache.hit_rate:.3f}, {text_cache.stats()}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
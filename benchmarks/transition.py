@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+
+from benchmarks.common import generate_map, init, measure
+
+import pygame
+
+from engine.level import Level
+from engine.loader import LevelLoader
+from entities.player import Player
+
+FRAME_DURATION = 1000 / 60
+
+
+def synchronous(directory: str, player: Player) -> float:
+    def load() -> None:
+        with open(os.path.join(directory, "2.txt"), "r") as file:
+            Level(2, player, file.read().splitlines())
+
+    return measure(load, 1)
+
+
+def preloaded(directory: str, player: Player, current: Level) -> tuple[float, int]:
+    loader = LevelLoader(budget=4.0, directory=directory)
+    loader.preload(2, player)
+
+    frames = []
+    level = None
+    while level is None:
+
+        def frame() -> None:
+            nonlocal level
+            loader.step()
+            current.update()
+            level = loader.take()
+
+        frames.append(measure(frame, 1))
+        time.sleep(max(0.0, FRAME_DURATION - frames[-1]) / 1000)
+
+    loader.shutdown()
+
+    return max(frames), len(frames)
+
+
+def main() -> None:
+    init()
+
+    print(
+        f"{'map':>9} {'sync ms':>9} {'update ms':>10} "
+        f"{'preload max ms':>15} {'frames':>7}"
+    )
+    for size in (20, 60, 120):
+        with tempfile.TemporaryDirectory() as directory:
+            for number in (1, 2):
+                with open(os.path.join(directory, f"{number}.txt"), "w") as file:
+                    file.write("\n".join(generate_map(size, size, 8, number)))
+
+            player = Player(0, 0)
+            current = Level(1, player, generate_map(size, size, 8))
+
+            sync = synchronous(directory, player)
+            update = measure(current.update, 1)
+            worst, frames = preloaded(directory, player, current)
+
+            print(
+                f"{size:>4}x{size:<4} {sync:>9.2f} {update:>10.2f} "
+                f"{worst:>15.2f} {frames:>7}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from typing import Any
 
 import pygame
 
+from engine.assets import assets
+
 
 class Animation:
     def __init__(
@@ -10,7 +12,7 @@ class Animation:
         self.animations = {}
 
         for animation_name, config in animations_config.items():
-            image = pygame.image.load(config["image_path"]).convert_alpha()
+            image = assets.image(config["image_path"])
             frames = self.__split_frames(image, size, config["num_frames"])
             self.animations[animation_name] = frames
 
@@ -20,6 +22,11 @@ class Animation:
     def get_current_frame(self, animation_name: str) -> pygame.Surface:
         return self.animations[animation_name][self.current_frames[animation_name]]
 
+    def reset(self) -> None:
+        for animation in self.animations:
+            self.__frame_counters[animation] = 0
+            self.current_frames[animation] = 0
+
     def update_frame(self, animation_name: str, frame_delay: int) -> None:
         self.__frame_counters[animation_name] += 1
 
@@ -0,0 +1,86 @@
+import threading
+
+import pygame
+
+
+class AssetCache:
+    def __init__(self) -> None:
+        self.__images: dict[
+            tuple[str, tuple[int, int] | None, bool | str], pygame.Surface
+        ] = {}
+        self.__decoded: dict[str, pygame.Surface] = {}
+        self.__lock = threading.Lock()
+
+        self.__hits = 0
+        self.__misses = 0
+
+    def image(
+        self, path: str, size: tuple[int, int] | None = None, alpha: bool = True
+    ) -> pygame.Surface:
+        key = (path, size, alpha)
+
+        surface = self.__images.get(key)
+        if surface is not None:
+            self.__hits += 1
+            return surface
+
+        self.__misses += 1
+
+        if size is None:
+            surface = self.__decoded.get(path) or pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        else:
+            surface = pygame.transform.scale(self.image(path, None, alpha), size)
+
+        with self.__lock:
+            self.__images[key] = surface
+            self.__decoded.pop(path, None)
+
+        return surface
+
+    def decode(self, path: str) -> None:
+        if path in self.__decoded or self.__is_loaded(path):
+            return
+
+        surface = pygame.image.load(path)
+
+        with self.__lock:
+            if not self.__is_loaded(path):
+                self.__decoded[path] = surface
+
+    def circle(self, size: int, color: str) -> pygame.Surface:
+        key = ("circle", (size, size), color)
+
+        surface = self.__images.get(key)
+        if surface is not None:
+            self.__hits += 1
+            return surface
+
+        self.__misses += 1
+
+        surface = pygame.Surface((size, size), pygame.SRCALPHA, 32).convert_alpha()
+        pygame.draw.circle(surface, color, (size // 2, size // 2), size // 2)
+
+        self.__images[key] = surface
+
+        return surface
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "entries": len(self.__images),
+            "decoded": len(self.__decoded),
+        }
+
+    def clear(self) -> None:
+        self.__images.clear()
+        self.__decoded.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __is_loaded(self, path: str) -> bool:
+        return any((path, None, alpha) in self.__images for alpha in (True, False))
+
+
+assets = AssetCache()
@@ -0,0 +1,129 @@
+import pygame
+
+SOUNDS = {
+    "chomp": ("assets/sounds/pacman_chomp.wav", 0.5, 1),
+    "eatfruit": ("assets/sounds/pacman_eatfruit.wav", 1.0, 1),
+    "death": ("assets/sounds/pacman_death.wav", 1.0, 1),
+}
+
+
+class AudioManager:
+    def __init__(self, channels: int = 8) -> None:
+        self.__channel_count = channels
+
+        self.__sounds: dict[str, pygame.mixer.Sound] = {}
+        self.__decoded: dict[str, pygame.mixer.Sound] = {}
+        self.__voices: dict[str, list[pygame.mixer.Channel]] = {}
+        self.__next_channel = 0
+
+        self.__music: str | None = None
+        self.__music_volume = 1.0
+        self.__is_music_started = False
+
+        self.__is_enabled = True
+        self.__is_paused = False
+
+    def load_music(self, path: str, volume: float = 1.0) -> None:
+        self.__music = path
+        self.__music_volume = volume
+        self.__is_music_started = False
+
+        if self.__is_enabled:
+            self.__start_music()
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled == self.__is_enabled:
+            return
+
+        self.__is_enabled = enabled
+
+        if not pygame.mixer.get_init():
+            return
+
+        if enabled:
+            self.__start_music()
+        else:
+            pygame.mixer.music.pause()
+            for voices in self.__voices.values():
+                for channel in voices:
+                    channel.stop()
+
+    def set_paused(self, paused: bool) -> None:
+        if paused == self.__is_paused:
+            return
+
+        self.__is_paused = paused
+
+        if not pygame.mixer.get_init():
+            return
+
+        for voices in self.__voices.values():
+            for channel in voices:
+                if paused:
+                    channel.pause()
+                else:
+                    channel.unpause()
+
+    def play(self, name: str) -> None:
+        if not self.__is_enabled or self.__is_paused or not pygame.mixer.get_init():
+            return
+
+        sound = self.__sound(name)
+
+        for channel in self.__voices[name]:
+            if not channel.get_busy():
+                channel.play(sound)
+                return
+
+    def decode(self, name: str) -> None:
+        if name in self.__sounds or name in self.__decoded:
+            return
+
+        if pygame.mixer.get_init():
+            self.__decoded[name] = pygame.mixer.Sound(SOUNDS[name][0])
+
+    def stop(self, name: str) -> None:
+        for channel in self.__voices.get(name, ()):
+            channel.stop()
+
+    def __sound(self, name: str) -> pygame.mixer.Sound:
+        sound = self.__sounds.get(name)
+        if sound is not None:
+            return sound
+
+        path, volume, voices = SOUNDS[name]
+
+        sound = self.__decoded.pop(name, None) or pygame.mixer.Sound(path)
+        self.__sounds[name] = sound
+        sound.set_volume(volume)
+
+        if pygame.mixer.get_num_channels() < self.__channel_count:
+            pygame.mixer.set_num_channels(self.__channel_count)
+        pygame.mixer.set_reserved(self.__channel_count)
+
+        self.__voices[name] = [self.__reserve_channel() for _ in range(voices)]
+
+        return sound
+
+    def __reserve_channel(self) -> pygame.mixer.Channel:
+        channel = pygame.mixer.Channel(self.__next_channel % self.__channel_count)
+        self.__next_channel += 1
+
+        return channel
+
+    def __start_music(self) -> None:
+        if self.__music is None or not pygame.mixer.get_init():
+            return
+
+        if self.__is_music_started:
+            pygame.mixer.music.unpause()
+            return
+
+        pygame.mixer.music.load(self.__music)
+        pygame.mixer.music.set_volume(self.__music_volume)
+        pygame.mixer.music.play(-1)
+
+        self.__is_music_started = True
+
+
+audio = AudioManager()
@@ -0,0 +1,26 @@
+import pygame
+
+
+class Camera:
+    def __init__(self, width: int, height: int) -> None:
+        self.__view = pygame.Rect(0, 0, width, height)
+
+    @property
+    def view(self) -> pygame.Rect:
+        return self.__view
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        return -self.__view.x, -self.__view.y
+
+    def resize(self, width: int, height: int) -> None:
+        self.__view.size = width, height
+
+    def follow(self, target: pygame.Rect, bounds: tuple[int, int]) -> None:
+        width, height = bounds
+
+        x = target.centerx - self.__view.width // 2
+        y = target.centery - self.__view.height // 2
+
+        self.__view.x = max(0, min(x, width - self.__view.width))
+        self.__view.y = max(0, min(y, height - self.__view.height))
@@ -0,0 +1,15 @@
+class SimulationClock:
+    def __init__(self) -> None:
+        self.__ticks = 0.0
+
+    def get_ticks(self) -> int:
+        return int(self.__ticks)
+
+    def advance(self, milliseconds: float) -> None:
+        self.__ticks += milliseconds
+
+    def reset(self) -> None:
+        self.__ticks = 0.0
+
+
+simulation_clock = SimulationClock()
@@ -1,24 +1,49 @@
 import sys
 import pygame
-from engine.settings import JsonSettings, SettingsManager
+from engine.assets import assets
+from engine.audio import SOUNDS, audio
+from engine.clock import simulation_clock
+from engine.latency import InputLatency
+from engine.settings import JsonSettings, SettingsManager, settings_writer
+from engine.timestep import FixedTimestep
 
 from entities.player import Player
 from engine.level import Level
+from engine.loader import LevelLoader
+from engine.preload import AssetPreloader
+from engine.profiler import FrameProfiler
+from engine.render import Layer, RenderQueue
+from engine.scheduler import ai_scheduler
+from engine.startup import startup_timer
+from engine.telemetry import TelemetryPublisher
 from engine.ui.menus import Menu
 from engine.ui.ui import UI
 
+BACKGROUND = "assets/images/background.jpg"
+
+AI_BUDGET = 2000
+
+PRELOAD_IMAGES = [
+    BACKGROUND,
+    "assets/images/wall.png",
+    "assets/images/pacman.png",
+    "assets/images/walk.png",
+    "assets/images/explosion.png",
+    "assets/images/ghost.png",
+    "assets/images/heart.png",
+    "assets/images/cherry.png",
+    "assets/images/blueberry.png",
+]
+
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, telemetry: str | None = None) -> None:
         pygame.init()
 
         pygame.mixer.init()
 
         pygame.display.set_caption("Pacman")
 
-        pygame.mixer.music.load("assets/sounds/music.wav")
-        pygame.mixer.music.set_volume(0.3)
-
         self.__settings = SettingsManager(JsonSettings("data/settings.json"))
         self.__settings.load()
 
@@ -26,18 +51,19 @@ class Game:
             self.__settings.get_size(), pygame.HWSURFACE | pygame.DOUBLEBUF
         )
 
-        self.__background_image = pygame.image.load(
-            "assets/images/background.jpg"
-        ).convert()
-        self.__background_image = pygame.transform.scale(
-            self.__background_image, self.__settings.get_size()
-        )
+        self.__preloader = AssetPreloader()
+        self.__preloader.start(PRELOAD_IMAGES, list(SOUNDS))
+
+        self.__background_image: pygame.Surface | None = None
 
         self.__clock = pygame.time.Clock()
+        self.__timestep = FixedTimestep()
+
+        ai_scheduler.set_budget(AI_BUDGET)
 
         self.__current_level = 1
 
-        self.__player: Player = Player(-100, -100)
+        self.__player: Player | None = None
 
         self.__menu = Menu(
             {"start": self.start, "quit": self.quit, "resume": self.resume},
@@ -48,45 +74,71 @@ class Game:
         self.__is_paused = False
         self.__is_running = True
 
-        self.__is_sound_enabled = self.__settings.get_sound_enabled()
+        audio.set_enabled(self.__settings.get_sound_enabled())
+        self.__settings.subscribe("sound", audio.set_enabled)
+        audio.load_music("assets/sounds/music.wav", 0.3)
 
         self.__is_debug = True
 
+        self.__profiler = FrameProfiler()
+        self.__profiler_font = pygame.font.Font(None, 24)
+        self.__latency = InputLatency()
+
         self.__level: Level | None = None
+        self.__loader = LevelLoader()
         self.__ui = UI()
+        self.__queue = RenderQueue()
+
+        self.__telemetry = (
+            TelemetryPublisher(telemetry) if telemetry is not None else None
+        )
+        if self.__telemetry is not None:
+            print(f"telemetry listening on {self.__telemetry.address}")
+
+        startup_timer.mark("init")
 
     def run(self) -> None:
         while self.__is_running:
-            self.__is_sound_enabled = self.__settings.get_sound_enabled()
-
-            self.soundtrack()
+            self.__profiler.begin_frame()
 
             self.handle_events()
+            self.__profiler.mark("events")
+
+            for _ in range(self.__timestep.steps()):
+                self.update()
+                self.publish()
+                simulation_clock.advance(self.__timestep.step)
+            self.__profiler.mark("update")
 
-            self.update()
+            if not self.__menu.is_open():
+                self.__loader.step()
+            self.__profiler.mark("load")
 
             self.clear_screen()
+            self.__profiler.mark("clear")
 
             self.draw()
+            self.__profiler.mark("draw")
+
+            if self.__is_debug:
+                self.__profiler.draw(self.__screen, self.__profiler_font)
+                self.__profiler.mark("overlay")
 
             pygame.display.flip()
+            self.__profiler.mark("flip")
 
-            self.__clock.tick(60)
+            self.track_latency()
 
-    def soundtrack(self) -> None:
-        if self.__is_sound_enabled:
-            if not pygame.mixer.music.get_busy():
-                pygame.mixer.music.play(-1)
-            else:
-                pygame.mixer.music.unpause()
+            startup_timer.mark("first_flip")
+            if startup_timer.enabled and self.__preloader.done:
+                startup_timer.mark("assets")
+                startup_timer.print_report()
+                self.quit()
 
-            if self.__level:
-                self.__level.enable_sound()
-        else:
-            pygame.mixer.music.pause()
+            self.__profiler.end_frame()
 
-            if self.__level:
-                self.__level.disable_sound()
+            self.__timestep.accumulate(self.__clock.tick(self.__settings.get_fps()))
+            self.__profiler.set_counter("skipped_ticks", self.__timestep.skipped)
 
     def handle_events(self) -> None:
         for event in pygame.event.get():
@@ -97,15 +149,19 @@ class Game:
                     if self.__is_debug:
                         self.debug_handle_keydown(event.key)
                     self.__menu.handle_keydown(event.key)
-                    self.__player.handle_keydown(event.key)
+                    if self.__player is not None:
+                        if self.__player.handle_keydown(event.key):
+                            self.__latency.press(self.__player.turns())
 
     def update(self) -> None:
-        if self.__level is None:
+        if self.__level is None or self.__player is None:
             return
 
+        audio.set_paused(self.__menu.is_open())
+
         if self.__menu.is_open():
             self.__menu.update()
-            return            
+            return
 
         if self.__player.dead() and self.__player.time_since_death() > 3500:
             self.__menu.open_new_record(self.__player.score())
@@ -113,31 +169,80 @@ class Game:
             return
 
         if self.__level.is_completed():
-            self.load_level(self.__current_level + 1)
+            self.next_level()
             return
 
         self.__level.update()
 
+    def publish(self) -> None:
+        if self.__telemetry is None or self.__menu.is_open():
+            return
+
+        if self.__level is None or self.__player is None:
+            return
+
+        self.__telemetry.publish(self.__level, self.__player)
+        for name, value in self.__telemetry.stats().items():
+            self.__profiler.set_counter(f"telemetry_{name}", value)
+
+    def track_latency(self) -> None:
+        if self.__player is None or self.__menu.is_open():
+            self.__latency.cancel()
+            return
+
+        latency = self.__latency.present(
+            self.__player.turns(), self.__player.turn_pending()
+        )
+        if latency is not None:
+            frames, milliseconds = latency
+            self.__profiler.record("latency_frames", frames)
+            self.__profiler.record("latency_ms", milliseconds)
+
     def draw(self) -> None:
         if self.__menu.is_open():
+            self.__queue.flush(self.__screen)
             self.__menu.draw(self.__screen)
+
+            if not self.__preloader.done:
+                self.draw_progress(self.__preloader.progress)
             return
 
-        if self.__level:
-            self.__level.draw(self.__screen)
+        if self.__level is None or self.__player is None:
+            self.__queue.flush(self.__screen)
+            return
+
+        self.__level.draw(self.__screen, self.__timestep.alpha, self.__queue)
 
-        self.__ui.display(
-            self.__screen,
+        self.__ui.render(
+            self.__queue,
             self.__settings.get_font(),
             self.__player.score(),
             self.__current_level,
             self.__player.health(),
         )
 
+        self.__queue.flush(self.__screen)
+
+    def draw_progress(self, progress: float) -> None:
+        width, height = self.__screen.get_size()
+        pygame.draw.rect(self.__screen, "yellow", (0, height - 6, width * progress, 6))
+
     def clear_screen(
         self,
     ) -> None:
-        self.__screen.blit(self.__background_image, (0, 0))
+        if self.__background_image is None and not self.__preloader.done:
+            self.__screen.fill("black")
+            return
+
+        self.__queue.push(self.background(), (0, 0), Layer.BACKGROUND)
+
+    def background(self) -> pygame.Surface:
+        if self.__background_image is None:
+            self.__background_image = assets.image(
+                BACKGROUND, self.__settings.get_size(), alpha=False
+            )
+
+        return self.__background_image
 
     def start(self) -> None:
         self.__menu.close()
@@ -164,15 +269,59 @@ class Game:
         self.__menu.close()
 
     def quit(self) -> None:
+        if self.__is_debug:
+            try:
+                self.__profiler.dump("data/profile.json")
+            except OSError as error:
+                print(f"could not write the profile: {error}", file=sys.stderr)
+
+        self.__loader.shutdown()
+        self.__preloader.shutdown()
+        if self.__telemetry is not None:
+            self.__telemetry.shutdown()
+
+        try:
+            self.__settings.flush()
+        except OSError as error:
+            print(f"could not save the settings: {error}", file=sys.stderr)
+        settings_writer.shutdown()
+
         pygame.quit()
         sys.exit()
 
     def load_level(self, level: int) -> None:
+        if self.__player is None:
+            return
+
         try:
             self.__current_level = level
             self.__level = Level(self.__current_level, self.__player)
+            self.__level.set_background(self.background())
         except FileNotFoundError:
+            self.__loader.cancel()
             self.__menu.open_game_over()
+            return
+
+        self.__loader.preload(level + 1, self.__player, self.background())
+
+    def next_level(self) -> None:
+        if self.__loader.number is None:
+            self.load_level(self.__current_level + 1)
+            return
+
+        try:
+            level = self.__loader.take()
+        except FileNotFoundError:
+            self.__menu.open_game_over()
+            return
+
+        if level is None:
+            return
+
+        self.__current_level = level.number
+        self.__level = level
+
+        self.__loader.preload(level.number + 1, level.player, self.background())
 
     def debug_handle_keydown(self, key: int) -> None:
         match key:
@@ -185,4 +334,5 @@ class Game:
                     self.load_level(1)
                 self.load_level(self.__current_level - 1)
             case pygame.K_F4:
-                self.__player.die()
+                if self.__player is not None:
+                    self.__player.die()
@@ -0,0 +1,70 @@
+import pygame
+
+TILE_SIZE = 40
+
+
+class WallGrid:
+    def __init__(self, columns: int, rows: int, tile_size: int = TILE_SIZE) -> None:
+        self.__columns = columns
+        self.__rows = rows
+        self.__tile_size = tile_size
+        self.__cells = bytearray(columns * rows)
+
+    @classmethod
+    def from_data(cls, data: list[str], tile: str = "=", tile_size: int = TILE_SIZE):
+        columns = max((len(line) for line in data), default=0)
+        grid = cls(columns, len(data), tile_size)
+
+        for y, line in enumerate(data):
+            for x, char in enumerate(line):
+                if char == tile:
+                    grid.set(x, y)
+
+        return grid
+
+    @property
+    def columns(self) -> int:
+        return self.__columns
+
+    @property
+    def rows(self) -> int:
+        return self.__rows
+
+    @property
+    def tile_size(self) -> int:
+        return self.__tile_size
+
+    @property
+    def cells(self) -> bytearray:
+        return self.__cells
+
+    def set(self, x: int, y: int, value: bool = True) -> None:
+        self.__cells[y * self.__columns + x] = value
+
+    def is_wall(self, x: int, y: int) -> bool:
+        if 0 <= x < self.__columns and 0 <= y < self.__rows:
+            return bool(self.__cells[y * self.__columns + x])
+
+        return False
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+
+        size = self.__tile_size
+
+        left = max(rect.left // size, 0)
+        right = min((rect.right - 1) // size, self.__columns - 1)
+        top = max(rect.top // size, 0)
+        bottom = min((rect.bottom - 1) // size, self.__rows - 1)
+
+        cells = self.__cells
+        columns = self.__columns
+
+        for y in range(top, bottom + 1):
+            row = y * columns
+            for x in range(left, right + 1):
+                if cells[row + x]:
+                    return True
+
+        return False
@@ -0,0 +1,32 @@
+import time
+
+
+class InputLatency:
+    def __init__(self) -> None:
+        self.__pressed_at: float | None = None
+        self.__turns = 0
+        self.__frames = 0
+
+    def press(self, turns: int) -> None:
+        self.__pressed_at = time.perf_counter()
+        self.__turns = turns
+        self.__frames = 0
+
+    def present(self, turns: int, pending: bool) -> tuple[int, float] | None:
+        if self.__pressed_at is None:
+            return None
+
+        self.__frames += 1
+
+        if turns == self.__turns:
+            if not pending:
+                self.__pressed_at = None
+            return None
+
+        latency = self.__frames, (time.perf_counter() - self.__pressed_at) * 1000
+        self.__pressed_at = None
+
+        return latency
+
+    def cancel(self) -> None:
+        self.__pressed_at = None
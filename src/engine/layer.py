@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from typing import Iterator
+
+import pygame
+
+from engine.grid import WallGrid
+from engine.pellets import PelletGrid
+from engine.render import Blit
+
+CHUNK = 8
+
+
+class TileLayer:
+    def __init__(
+        self,
+        walls: WallGrid,
+        pellets: PelletGrid,
+        wall_image: pygame.Surface,
+        background: pygame.Surface | None = None,
+        chunk: int = CHUNK,
+        max_chunks: int = 64,
+    ) -> None:
+        self.__walls = walls
+        self.__pellets = pellets
+        self.__wall_image = wall_image
+        self.__background = background
+
+        self.__chunk = chunk
+        self.__chunk_size = chunk * walls.tile_size
+        self.__max_chunks = max_chunks
+
+        self.__bounds = pygame.Rect(
+            0, 0, walls.columns * walls.tile_size, walls.rows * walls.tile_size
+        )
+
+        self.__chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+
+        self.__renders = 0
+
+    @property
+    def renders(self) -> int:
+        return self.__renders
+
+    def draw(self, screen: pygame.Surface, view: pygame.Rect) -> None:
+        screen.blits(self.render(view), False)
+
+    def render(self, view: pygame.Rect) -> list[Blit]:
+        return [
+            (surface, (x - view.x, y - view.y))
+            for surface, x, y in self.__visible(view)
+        ]
+
+    def warm(self, view: pygame.Rect) -> Iterator[None]:
+        for _ in self.__visible(view):
+            yield
+
+    def erase(self, rect: pygame.Rect) -> None:
+        size = self.__chunk_size
+
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                surface = self.__chunks.get((cx, cy))
+                if surface is None:
+                    continue
+
+                local = rect.move(-cx * size, -cy * size)
+
+                if self.__background is None:
+                    surface.fill((0, 0, 0, 0), local)
+                else:
+                    surface.set_clip(local)
+                    self.__paint_background(
+                        surface, self.__background, cx * size, cy * size
+                    )
+                    surface.set_clip(None)
+
+    def __visible(self, view: pygame.Rect) -> Iterator[tuple[pygame.Surface, int, int]]:
+        area = view.clip(self.__bounds)
+        if not area.width or not area.height:
+            return
+
+        size = self.__chunk_size
+
+        for cy in range(area.top // size, (area.bottom - 1) // size + 1):
+            for cx in range(area.left // size, (area.right - 1) // size + 1):
+                yield self.__get(cx, cy), cx * size, cy * size
+
+    def __get(self, cx: int, cy: int) -> pygame.Surface:
+        key = cx, cy
+
+        surface = self.__chunks.get(key)
+        if surface is not None:
+            self.__chunks.move_to_end(key)
+            return surface
+
+        surface = self.__chunks[key] = self.__render(cx, cy)
+
+        if len(self.__chunks) > self.__max_chunks:
+            self.__chunks.popitem(last=False)
+
+        return surface
+
+    def __render(self, cx: int, cy: int) -> pygame.Surface:
+        self.__renders += 1
+
+        size = self.__chunk_size
+        area = pygame.Rect(cx * size, cy * size, size, size).clip(self.__bounds)
+
+        if self.__background is None:
+            surface = pygame.Surface(area.size, pygame.SRCALPHA, 32).convert_alpha()
+        else:
+            surface = pygame.Surface(area.size).convert()
+            self.__paint_background(surface, self.__background, area.x, area.y)
+
+        tile_size = self.__walls.tile_size
+
+        left, top = cx * self.__chunk, cy * self.__chunk
+        right = min(left + self.__chunk, self.__walls.columns)
+        bottom = min(top + self.__chunk, self.__walls.rows)
+
+        blits: list[Blit] = []
+
+        for y in range(top, bottom):
+            for x in range(left, right):
+                if self.__walls.is_wall(x, y):
+                    blits.append(
+                        (
+                            self.__wall_image,
+                            (x * tile_size - area.x, y * tile_size - area.y),
+                        )
+                    )
+
+        for x, y, kind in self.__pellets.region(left, top, right, bottom):
+            blits.append((kind.image(), kind.rect(x, y).move(-area.x, -area.y)))
+
+        surface.blits(blits, False)
+
+        return surface
+
+    @staticmethod
+    def __paint_background(
+        surface: pygame.Surface, background: pygame.Surface, x: int, y: int
+    ) -> None:
+        width, height = background.get_size()
+
+        for top in range(y - y % height, y + surface.get_height(), height):
+            for left in range(x - x % width, x + surface.get_width(), width):
+                surface.blit(background, (left - x, top - y))
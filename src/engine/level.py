@@ -1,73 +1,271 @@
 import os
+from typing import Iterator
+
 import pygame
 
+from engine.assets import assets
+from engine.camera import Camera
+from engine.grid import TILE_SIZE, WallGrid
+from engine.layer import CHUNK, TileLayer
+from engine.navigation import FlowField
+from engine.pellets import PelletGrid
+from engine.render import Layer, RenderQueue
+from engine.scheduler import ai_scheduler
+from engine.sight import SightIndex
+from engine.spatial import ChunkIndex
 from entities.player import Player
-from entities.food import Food
-from entities.wall import Wall
+from entities.food import FOOD_KINDS, FOOD_TILES
 from entities.ghost import Ghost
 
 
+class LevelLayout:
+    def __init__(self, data: list[str]) -> None:
+        self.data = data
+        self.walls = WallGrid.from_data(data)
+        self.sight = SightIndex(self.walls)
+
+    @classmethod
+    def read(cls, number: int, directory: str = "assets/levels") -> "LevelLayout":
+        filename = os.path.join(directory, f"{number}.txt")
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Level {number} not found")
+
+        with open(filename, "r") as file:
+            return cls(file.read().splitlines())
+
+
 class Level(pygame.sprite.Group):
-    def __init__(self, number: int, player: Player) -> None:
+    def __init__(
+        self, number: int, player: Player, data: list[str] | None = None
+    ) -> None:
         super().__init__()
 
         self.__player = player
 
         self.__number = number
 
-        self.load()
+        self.__walls = WallGrid(0, 0)
+        self.__navigation = FlowField(self.__walls)
+        self.__sight = SightIndex(self.__walls)
+
+        self.__ghosts: pygame.sprite.Group[Ghost] = pygame.sprite.Group()
+        self.__ghost_chunks: ChunkIndex[Ghost] = ChunkIndex(CHUNK * TILE_SIZE)
+        self.__pellets = PelletGrid(0, 0, FOOD_KINDS, TILE_SIZE)
+        self.__eaten: list[tuple[int, int]] = []
+
+        self.__layer: TileLayer | None = None
+        self.__background: pygame.Surface | None = None
+        self.__camera = Camera(*self.__view_size())
+
+        self.__spawn: tuple[int, int] | None = None
+
+        if data is None:
+            self.load()
+        else:
+            self.create(data)
 
     @property
     def player(self) -> Player:
         return self.__player
 
+    @property
+    def number(self) -> int:
+        return self.__number
+
+    @property
+    def walls(self) -> WallGrid:
+        return self.__walls
+
+    @property
+    def navigation(self) -> FlowField:
+        return self.__navigation
+
+    @property
+    def sight(self) -> SightIndex:
+        return self.__sight
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.__walls.columns * TILE_SIZE, self.__walls.rows * TILE_SIZE
+
+    @property
+    def layer(self) -> TileLayer | None:
+        return self.__layer
+
+    @property
+    def camera(self) -> Camera:
+        return self.__camera
+
+    @property
+    def pellets(self) -> PelletGrid:
+        return self.__pellets
+
+    @property
+    def ghosts(self) -> pygame.sprite.Group:
+        return self.__ghosts
+
+    @property
+    def eaten(self) -> list[tuple[int, int]]:
+        return self.__eaten
+
+    @classmethod
+    def staged(
+        cls, number: int, player: Player, layout: LevelLayout
+    ) -> tuple["Level", Iterator[None]]:
+        level = cls(number, player, [])
+        return level, level.build(layout)
+
     def load(self) -> None:
-        filename = f"assets/levels/{self.__number}.txt"
-        if not os.path.exists(filename):
-            raise FileNotFoundError(f"Level {self.__number} not found")
+        self.__create(LevelLayout.read(self.__number))
 
-        with open(f"assets/levels/{self.__number}.txt", "r") as file:
-            data = file.read().splitlines()
+    def create(self, data: list[str]) -> None:
+        self.__create(LevelLayout(data))
 
+    def build(self, layout: LevelLayout) -> Iterator[None]:
         self.empty()
+        self.__ghosts.empty()
+        self.__ghost_chunks.clear()
 
-        self.create(data)
+        self.__walls = layout.walls
+        self.__navigation = FlowField(self.__walls)
+        self.__sight = layout.sight
+        self.__pellets = PelletGrid(
+            self.__walls.columns, self.__walls.rows, FOOD_KINDS, TILE_SIZE
+        )
+        self.__eaten = []
 
-    def create(self, data) -> None:
-        for y, line in enumerate(data):
+        self.__spawn = None
+        self.__layer = None
+
+        for y, line in enumerate(layout.data):
             for x, tile in enumerate(line):
                 match tile:
-                    case "=":
-                        self.add(Wall(x, y))
                     case "P":
-                        self.__player.respawn(x * 40 + 5, y * 40 + 5)
-                    case "*":
-                        self.add(Food(x, y, "food"))
-                    case "C":
-                        self.add(Food(x, y, "cherry"))
-                    case "B":
-                        self.add(Food(x, y, "blueberry"))
+                        self.__spawn = x * TILE_SIZE + 5, y * TILE_SIZE + 5
+                    case "*" | "C" | "B":
+                        kind = FOOD_TILES[tile]
+                        points = FOOD_KINDS[kind - 1].points()
+                        self.__pellets.add(x, y, kind, points)
                     case "G":
                         speed = round(self.__number * 0.25 + 2)
-                        self.add(Ghost(x, y, speed))
+                        ghost = Ghost(x, y, speed, self, self.__ghosts)
+                        self.__ghost_chunks.move(ghost, *ghost.rect.center)
+                    case _:
+                        continue
+
+                yield
+
+        if self.__background is not None:
+            self.__layer = self.__create_layer()
+
+            if self.__spawn is not None:
+                self.__camera.follow(
+                    pygame.Rect(self.__spawn, self.__player.rect.size), self.size
+                )
+                yield from self.__layer.warm(self.__camera.view)
+
+    def spawn_player(self) -> None:
+        if self.__spawn is not None:
+            self.__player.respawn(*self.__spawn)
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        alpha: float = 1.0,
+        queue: RenderQueue | None = None,
+    ) -> None:
+        if self.__layer is None:
+            self.__layer = self.__create_layer()
+
+        if self.__camera.view.size != screen.get_size():
+            self.__camera.resize(*screen.get_size())
+
+        focus = self.__player.rect.copy()
+        focus.topleft = self.__player.interpolate(alpha)
+        self.__camera.follow(focus, self.size)
+
+        view = self.__camera.view
+        offset = self.__camera.offset
+
+        target = queue if queue is not None else RenderQueue()
 
-    def draw(self, screen: pygame.Surface) -> None:
-        for sprite in self.sprites():
-            sprite.draw(screen)
+        target.extend(self.__layer.render(view), Layer.TILES)
 
-        self.__player.draw(screen)
+        if len(self.__ghost_chunks) > len(self.__ghosts):
+            self.__ghost_chunks.retain(self.__ghosts)
+
+        margin = view.inflate(TILE_SIZE, TILE_SIZE)
+        target.extend(
+            [
+                blit
+                for ghost in self.__ghost_chunks.query(
+                    margin.inflate(TILE_SIZE, TILE_SIZE)
+                )
+                if margin.colliderect(ghost.rect)
+                and (blit := ghost.render(offset, alpha)) is not None
+            ],
+            Layer.ENTITIES,
+        )
+
+        player = self.__player.render(offset, alpha)
+        if player is not None:
+            target.push(*player, Layer.PLAYER)
+
+        if queue is None:
+            target.flush(screen)
 
     def update(self) -> None:
-        for sprite in self.sprites():
-            sprite.update(self)
+        for ghost in self.__ghosts.sprites():
+            ghost.store_position()
+        self.__player.store_position()
+
+        x, y = self.__player.rect.center
+        self.__navigation.update(x // TILE_SIZE, y // TILE_SIZE)
+
+        ghosts = self.__ghosts.sprites()
+        ai_scheduler.update(ghosts, self)
+
+        for ghost in ghosts:
+            self.__ghost_chunks.move(ghost, *ghost.rect.center)
 
         self.__player.update(self)
 
-    def disable_sound(self) -> None:
-        self.__player.disable_sound()
+    def set_background(self, background: pygame.Surface | None) -> None:
+        self.__background = background
+        self.__layer = None
+
+    def eat(self, rect: pygame.Rect) -> list[tuple[str, int]]:
+        eaten = []
 
-    def enable_sound(self) -> None:
-        self.__player.enable_sound()
+        for kind, points, pellet_rect in self.__pellets.eat(rect):
+            eaten.append((kind.tag, points))
+            self.__eaten.append(
+                (pellet_rect.x // TILE_SIZE, pellet_rect.y // TILE_SIZE)
+            )
+
+            if self.__layer is not None:
+                self.__layer.erase(pellet_rect)
+
+        return eaten
 
     def is_completed(self) -> bool:
-        return not any(isinstance(entity, Food) for entity in self.sprites())
+        return not self.__pellets
+
+    def __create_layer(self) -> TileLayer:
+        return TileLayer(
+            self.__walls,
+            self.__pellets,
+            assets.image("assets/images/wall.png", (TILE_SIZE, TILE_SIZE)),
+            self.__background,
+        )
+
+    @staticmethod
+    def __view_size() -> tuple[int, int]:
+        screen = pygame.display.get_surface()
+        return screen.get_size() if screen is not None else (0, 0)
+
+    def __create(self, layout: LevelLayout) -> None:
+        for _ in self.build(layout):
+            pass
+
+        self.spawn_player()
@@ -0,0 +1,99 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
+import pygame
+
+from engine.level import Level, LevelLayout
+from entities.player import Player
+
+
+class LevelLoader:
+    def __init__(self, budget: float = 4.0, directory: str = "assets/levels") -> None:
+        self.__budget = budget / 1000
+        self.__directory = directory
+
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+
+        self.__number: int | None = None
+        self.__player: Player | None = None
+        self.__future: Future | None = None
+        self.__background: pygame.Surface | None = None
+
+        self.__level: Level | None = None
+        self.__steps: Iterator[None] | None = None
+        self.__is_ready = False
+
+    @property
+    def number(self) -> int | None:
+        return self.__number
+
+    def preload(
+        self, number: int, player: Player, background: pygame.Surface | None = None
+    ) -> None:
+        self.cancel()
+
+        self.__number = number
+        self.__player = player
+        self.__background = background
+        self.__future = self.__executor.submit(
+            LevelLayout.read, number, self.__directory
+        )
+
+    def cancel(self) -> None:
+        if self.__future is not None:
+            self.__future.cancel()
+
+        self.__number = None
+        self.__future = None
+        self.__level = None
+        self.__steps = None
+        self.__is_ready = False
+
+    def step(self) -> None:
+        if self.__is_ready or self.__future is None or not self.__future.done():
+            return
+
+        if self.__future.cancelled() or self.__future.exception() is not None:
+            return
+
+        if self.__number is None or self.__player is None:
+            return
+
+        if self.__steps is None:
+            self.__level, self.__steps = Level.staged(
+                self.__number, self.__player, self.__future.result()
+            )
+            self.__level.set_background(self.__background)
+
+        deadline = time.perf_counter() + self.__budget
+
+        for _ in self.__steps:
+            if time.perf_counter() >= deadline:
+                return
+
+        self.__is_ready = True
+
+    def take(self) -> Level | None:
+        if self.__future is None:
+            return None
+
+        if self.__future.done():
+            error = self.__future.exception()
+            if error is not None:
+                self.cancel()
+                raise error
+
+        if not self.__is_ready or self.__level is None:
+            return None
+
+        level = self.__level
+        self.cancel()
+
+        level.spawn_player()
+
+        return level
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self.__executor.shutdown(wait=False)
@@ -0,0 +1,86 @@
+from array import array
+from collections import deque
+
+from engine.grid import WallGrid
+
+DIRECTIONS = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
+RIGHT, LEFT, DOWN, UP = 1, 2, 3, 4
+
+UNREACHABLE = -1
+
+
+class FlowField:
+    def __init__(self, walls: WallGrid) -> None:
+        self.__walls = walls
+        self.__columns = walls.columns
+        self.__rows = walls.rows
+
+        self.__target: tuple[int, int] | None = None
+        self.__is_dirty = False
+        self.__directions = bytearray(self.__columns * self.__rows)
+
+        self.__rebuilds = 0
+
+    @property
+    def rebuilds(self) -> int:
+        return self.__rebuilds
+
+    def update(self, x: int, y: int) -> None:
+        if self.__columns == 0 or self.__rows == 0:
+            return
+
+        x %= self.__columns
+        y %= self.__rows
+
+        if self.__target == (x, y):
+            return
+
+        self.__target = x, y
+        self.__is_dirty = True
+
+    def direction(self, x: int, y: int) -> tuple[int, int]:
+        if not (0 <= x < self.__columns and 0 <= y < self.__rows):
+            return DIRECTIONS[0]
+
+        if self.__is_dirty:
+            self.__rebuild()
+
+        return DIRECTIONS[self.__directions[y * self.__columns + x]]
+
+    def __rebuild(self) -> None:
+        self.__is_dirty = False
+
+        if self.__target is None:
+            return
+
+        self.__rebuilds += 1
+
+        columns, rows = self.__columns, self.__rows
+        walls = self.__walls.cells
+
+        distances = array("i", [UNREACHABLE]) * (columns * rows)
+        directions = self.__directions = bytearray(columns * rows)
+
+        x, y = self.__target
+        start = y * columns + x
+
+        distances[start] = 0
+        queue = deque([start])
+
+        while queue:
+            index = queue.popleft()
+            y, x = divmod(index, columns)
+            distance = distances[index] + 1
+
+            for cell, direction in (
+                (index + 1 if x + 1 < columns else index - x, LEFT),
+                (index - 1 if x > 0 else index + columns - 1, RIGHT),
+                (index + columns if y + 1 < rows else x, UP),
+                (index - columns if y > 0 else index + (rows - 1) * columns, DOWN),
+            ):
+                if distances[cell] != UNREACHABLE or walls[cell]:
+                    continue
+
+                distances[cell] = distance
+                directions[cell] = direction
+                queue.append(cell)
@@ -0,0 +1,83 @@
+from array import array
+from typing import Iterator, Sequence
+
+import pygame
+
+from entities.food import FoodKind
+
+
+class PelletGrid:
+    def __init__(
+        self, columns: int, rows: int, kinds: Sequence[FoodKind], tile_size: int
+    ) -> None:
+        self.__columns = columns
+        self.__rows = rows
+        self.__kinds = kinds
+        self.__tile_size = tile_size
+
+        self.__cells = bytearray(columns * rows)
+        self.__points = array("H", [0]) * (columns * rows)
+
+        self.__remaining = 0
+
+    def __len__(self) -> int:
+        return self.__remaining
+
+    def __iter__(self) -> Iterator[tuple[int, int, FoodKind]]:
+        columns = self.__columns
+
+        for index, kind in enumerate(self.__cells):
+            if kind:
+                yield index % columns, index // columns, self.__kinds[kind - 1]
+
+    def region(
+        self, left: int, top: int, right: int, bottom: int
+    ) -> Iterator[tuple[int, int, FoodKind]]:
+        columns = self.__columns
+        cells = self.__cells
+
+        for y in range(max(top, 0), min(bottom, self.__rows)):
+            row = y * columns
+            for x in range(max(left, 0), min(right, columns)):
+                kind = cells[row + x]
+                if kind:
+                    yield x, y, self.__kinds[kind - 1]
+
+    def add(self, x: int, y: int, kind: int, points: int) -> None:
+        index = y * self.__columns + x
+
+        if not self.__cells[index]:
+            self.__remaining += 1
+
+        self.__cells[index] = kind
+        self.__points[index] = points
+
+    def eat(self, rect: pygame.Rect) -> list[tuple[FoodKind, int, pygame.Rect]]:
+        size = self.__tile_size
+
+        left = max(rect.left // size, 0)
+        right = min((rect.right - 1) // size, self.__columns - 1)
+        top = max(rect.top // size, 0)
+        bottom = min((rect.bottom - 1) // size, self.__rows - 1)
+
+        eaten = []
+
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                index = y * self.__columns + x
+
+                kind = self.__cells[index]
+                if not kind:
+                    continue
+
+                pellet = self.__kinds[kind - 1]
+                pellet_rect = pellet.rect(x, y)
+                if not rect.colliderect(pellet_rect):
+                    continue
+
+                eaten.append((pellet, self.__points[index], pellet_rect))
+
+                self.__cells[index] = 0
+                self.__remaining -= 1
+
+        return eaten
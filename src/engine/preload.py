@@ -0,0 +1,37 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from engine.assets import assets
+from engine.audio import audio
+
+
+class AssetPreloader:
+    def __init__(self) -> None:
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        self.__futures: list[Future] = []
+
+    @property
+    def progress(self) -> float:
+        if not self.__futures:
+            return 1.0
+
+        done = sum(future.done() for future in self.__futures)
+        return done / len(self.__futures)
+
+    @property
+    def done(self) -> bool:
+        return all(future.done() for future in self.__futures)
+
+    def start(self, images: list[str], sounds: list[str]) -> None:
+        tasks: list[tuple[Callable[[str], None], str]] = [
+            *((assets.decode, path) for path in images),
+            *((audio.decode, name) for name in sounds),
+        ]
+
+        self.__futures = [self.__executor.submit(task, arg) for task, arg in tasks]
+
+    def shutdown(self) -> None:
+        for future in self.__futures:
+            future.cancel()
+
+        self.__executor.shutdown(wait=False)
@@ -0,0 +1,105 @@
+import json
+import time
+from collections import deque
+
+import pygame
+
+
+class FrameProfiler:
+    def __init__(self, budget: float = 1000 / 60, window: int = 600) -> None:
+        self.__budget = budget
+        self.__window = window
+
+        self.__samples: dict[str, deque[float]] = {}
+        self.__counters: dict[str, int] = {}
+
+        self.__frames = 0
+        self.__dropped = 0
+
+        self.__frame_start = 0.0
+        self.__phase_start = 0.0
+
+        self.__overlay: list[pygame.Surface] = []
+
+    @property
+    def frames(self) -> int:
+        return self.__frames
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    def begin_frame(self) -> None:
+        self.__frame_start = self.__phase_start = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.record(phase, (now - self.__phase_start) * 1000)
+        self.__phase_start = now
+
+    def end_frame(self) -> None:
+        busy = (self.__phase_start - self.__frame_start) * 1000
+
+        self.record("frame", busy)
+        self.__frames += 1
+
+        if busy > self.__budget:
+            self.__dropped += 1
+
+    def set_counter(self, name: str, value: int) -> None:
+        self.__counters[name] = value
+
+    def record(self, phase: str, duration: float) -> None:
+        samples = self.__samples.get(phase)
+        if samples is None:
+            samples = self.__samples[phase] = deque(maxlen=self.__window)
+
+        samples.append(duration)
+
+    def percentiles(self, phase: str) -> dict[str, float]:
+        samples = sorted(self.__samples.get(phase, ()))
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        def rank(percent: int) -> float:
+            return samples[min(len(samples) - 1, len(samples) * percent // 100)]
+
+        return {"p50": rank(50), "p95": rank(95), "p99": rank(99)}
+
+    def report(self) -> dict:
+        return {
+            "frames": self.__frames,
+            "dropped": self.__dropped,
+            "budget_ms": self.__budget,
+            "counters": dict(self.__counters),
+            "phases": {phase: self.percentiles(phase) for phase in self.__samples},
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=4)
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+        if not self.__overlay or self.__frames % 30 == 0:
+            self.__overlay = [
+                font.render(line, True, "white", "black")
+                for line in self.__format_lines()
+            ]
+
+        width = screen.get_width()
+        for i, text in enumerate(self.__overlay):
+            screen.blit(text, (width - text.get_width(), i * text.get_height()))
+
+    def __format_lines(self) -> list[str]:
+        lines = [
+            f"frames {self.__frames} dropped {self.__dropped}",
+            *(f"{name} {value}" for name, value in self.__counters.items()),
+        ]
+
+        for phase in self.__samples:
+            values = self.percentiles(phase)
+            lines.append(
+                f"{phase} {values['p50']:.2f}/{values['p95']:.2f}/{values['p99']:.2f}"
+            )
+
+        return lines
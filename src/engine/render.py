@@ -0,0 +1,45 @@
+from enum import IntEnum
+
+import pygame
+
+Blit = tuple[pygame.Surface, tuple[int, int] | pygame.Rect]
+
+
+class Layer(IntEnum):
+    BACKGROUND = 0
+    TILES = 1
+    ENTITIES = 2
+    PLAYER = 3
+    UI = 4
+
+
+class RenderQueue:
+    def __init__(self) -> None:
+        self.__layers: list[list[Blit]] = [[] for _ in Layer]
+
+        self.__items = 0
+
+    @property
+    def items(self) -> int:
+        return self.__items
+
+    def push(
+        self, surface: pygame.Surface, dest, layer: Layer = Layer.ENTITIES
+    ) -> None:
+        self.__layers[layer].append((surface, dest))
+
+    def extend(self, blits: list[Blit], layer: Layer = Layer.ENTITIES) -> None:
+        self.__layers[layer].extend(blits)
+
+    def flush(self, screen: pygame.Surface) -> None:
+        self.__items = 0
+
+        for blits in self.__layers:
+            if not blits:
+                continue
+
+            screen.blits(blits, False)
+
+            self.__items += len(blits)
+
+            blits.clear()
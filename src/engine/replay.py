@@ -0,0 +1,105 @@
+import json
+from typing import Callable
+
+import pygame
+
+InputSource = Callable[[int, list[pygame.event.Event]], int | None]
+
+VERSION = 2
+
+
+class Replay:
+    def __init__(
+        self,
+        seed: int,
+        runs: list[tuple[int | None, int]],
+        result: dict | None = None,
+    ) -> None:
+        self.__seed = seed
+        self.__runs = runs
+        self.__result = result or {}
+
+    @property
+    def seed(self) -> int:
+        return self.__seed
+
+    @property
+    def runs(self) -> list[tuple[int | None, int]]:
+        return self.__runs
+
+    @property
+    def frames(self) -> int:
+        return sum(count for _, count in self.__runs)
+
+    @property
+    def result(self) -> dict:
+        return self.__result
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "version": VERSION,
+                    "seed": self.__seed,
+                    "frames": self.frames,
+                    "result": self.__result,
+                    "inputs": [[key, count] for key, count in self.__runs],
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "r") as file:
+            data = json.load(file)
+
+        if data.get("version") != VERSION:
+            raise ValueError(f"unsupported replay version: {data.get('version')}")
+
+        return cls(
+            data["seed"],
+            [(key, count) for key, count in data["inputs"]],
+            data.get("result"),
+        )
+
+
+class Recorder:
+    def __init__(self, source: InputSource) -> None:
+        self.__source = source
+        self.__runs: list[list] = []
+
+    def __call__(self, frame: int, events: list[pygame.event.Event]) -> int | None:
+        key = self.__source(frame, events)
+
+        if self.__runs and self.__runs[-1][0] == key:
+            self.__runs[-1][1] += 1
+        else:
+            self.__runs.append([key, 1])
+
+        return key
+
+    def replay(self, seed: int, result: dict | None = None) -> Replay:
+        return Replay(seed, [(key, count) for key, count in self.__runs], result)
+
+
+class ReplayInput:
+    def __init__(self, replay: Replay) -> None:
+        self.__runs = replay.runs
+
+        self.__run = 0
+        self.__start = 0
+
+    def __call__(self, frame: int, _: list[pygame.event.Event]) -> int | None:
+        if frame < self.__start:
+            self.__run = self.__start = 0
+
+        while self.__run < len(self.__runs):
+            key, count = self.__runs[self.__run]
+
+            if frame < self.__start + count:
+                return key
+
+            self.__start += count
+            self.__run += 1
+
+        return None
@@ -0,0 +1,59 @@
+import time
+from typing import Sequence
+
+import pygame
+
+
+class AIScheduler:
+    def __init__(self, budget: float | None = None) -> None:
+        self.__budget = budget
+
+        self.__cursor = 0
+
+        self.__frames = 0
+        self.__plans = 0
+        self.__deferred = 0
+
+    def set_budget(self, budget: float | None) -> None:
+        self.__budget = budget
+
+    def update(self, agents: Sequence, group: pygame.sprite.Group) -> None:
+        count = len(agents)
+        if count == 0:
+            return
+
+        start = self.__cursor % count
+        budget = None if self.__budget is None else self.__budget / 1e6
+
+        planned = 0
+        spent = 0.0
+
+        for offset in range(count):
+            agent = agents[(start + offset) % count]
+
+            if planned == 0 or budget is None or spent < budget:
+                began = time.perf_counter()
+                agent.plan(group)
+                spent += time.perf_counter() - began
+                planned += 1
+
+            agent.move(group)
+
+        self.__cursor = (start + planned) % count
+
+        self.__frames += 1
+        self.__plans += planned
+        self.__deferred += count - planned
+
+    def reset(self) -> None:
+        self.__cursor = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "frames": self.__frames,
+            "plans": self.__plans,
+            "deferred": self.__deferred,
+        }
+
+
+ai_scheduler = AIScheduler()
@@ -1,14 +1,74 @@
 import os
 import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple
 
 import pygame
 
 
+class SettingsWriter:
+    def __init__(self) -> None:
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        self.__lock = threading.Lock()
+
+        self.__pending: dict[str, dict] = {}
+        self.__error: OSError | None = None
+
+    def write(self, path: str, data: dict) -> None:
+        with self.__lock:
+            is_queued = path in self.__pending
+            self.__pending[path] = dict(data)
+
+        if not is_queued:
+            self.__executor.submit(self.__write, path)
+
+    def flush(self) -> None:
+        self.__executor.submit(lambda: None).result()
+
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown(wait=True)
+
+    def __write(self, path: str) -> None:
+        with self.__lock:
+            data = self.__pending.pop(path)
+
+        try:
+            self.__replace(path, data)
+        except OSError as error:
+            self.__error = error
+
+    @staticmethod
+    def __replace(path: str, data: dict) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "w") as file:
+                json.dump(data, file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temporary, path)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+
+settings_writer = SettingsWriter()
+
+
 class AbstractSettings(ABC):
     @abstractmethod
-    def get(self, key: str, default: Any) -> None:
+    def get(self, key: str, default: Any) -> Any:
         ...
 
     @abstractmethod
@@ -23,11 +83,15 @@ class AbstractSettings(ABC):
     def load(self) -> None:
         ...
 
+    def flush(self) -> None:
+        ...
+
 
 class JsonSettings(AbstractSettings):
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, writer: SettingsWriter = settings_writer) -> None:
         self.__path = path
         self.__data = {}
+        self.__writer = writer
 
     def get(self, key: str, default: Any) -> Any:
         return self.__data.get(key, default)
@@ -36,8 +100,10 @@ class JsonSettings(AbstractSettings):
         self.__data[key] = value
 
     def save(self) -> None:
-        with open(self.__path, "w") as file:
-            json.dump(self.__data, file, indent=4)
+        self.__writer.write(self.__path, self.__data)
+
+    def flush(self) -> None:
+        self.__writer.flush()
 
     def load(self) -> None:
         if os.path.exists(self.__path):
@@ -48,52 +114,106 @@ class JsonSettings(AbstractSettings):
 class FontManager:
     def __init__(self) -> None:
         self.__size_names = ["small", "default", "large", "huge"]
+        self.__sizes = dict(zip(self.__size_names, [32, 48, 64, 80]))
         self.__fonts: dict[str, pygame.font.Font] = {}
 
-        self.__init_fonts()
-
-    def __init_fonts(self) -> None:
-        for size_name, size in zip(self.__size_names, [32, 48, 64, 80]):
-            self.__fonts[size_name] = pygame.font.Font(None, size)
-
     def get(self, name: str) -> pygame.font.Font:
-        return self.__fonts[name]
+        font = self.__fonts.get(name)
+        if font is None:
+            font = self.__fonts[name] = pygame.font.Font(None, self.__sizes[name])
+
+        return font
 
     def get_size_names(self) -> list[str]:
         return self.__size_names
 
 
+class SettingsSnapshot(NamedTuple):
+    width: int
+    height: int
+    fps: int
+    font: str
+    font_size: str
+    highscore: int
+    sound: bool
+
+    @classmethod
+    def read(cls, settings: AbstractSettings) -> "SettingsSnapshot":
+        return cls(
+            width=settings.get("width", 800),
+            height=settings.get("height", 800),
+            fps=settings.get("fps", 60),
+            font=settings.get("font", "default"),
+            font_size=settings.get("font_size", "default"),
+            highscore=settings.get("highscore", 0),
+            sound=settings.get("sound", True),
+        )
+
+
 class SettingsManager:
     def __init__(self, settings: AbstractSettings) -> None:
         self.__settings = settings
         self.__font_manager = FontManager()
 
+        self.__listeners: dict[str, list[Callable[[Any], None]]] = {}
+
+        self.__snapshot = SettingsSnapshot.read(self.__settings)
+        self.__font = self.__font_manager.get(self.__snapshot.font)
+
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        return self.__snapshot
+
     def get_size(self) -> tuple[int, int]:
-        return self.__settings.get("width", 800), self.__settings.get("height", 800)
+        return self.__snapshot.width, self.__snapshot.height
 
     def get_fps(self) -> int:
-        return self.__settings.get("fps", 60)
+        return self.__snapshot.fps
 
     def get_font(self) -> pygame.font.Font:
-        return self.__font_manager.get(self.__settings.get("font", "default"))
+        return self.__font
 
     def get_font_size(self) -> str:
-        return self.__settings.get("font_size", "default")
+        return self.__snapshot.font_size
 
     def get_font_size_names(self) -> list[str]:
         return self.__font_manager.get_size_names()
 
     def get_highscore(self) -> int:
-        return self.__settings.get("highscore", 0)
+        return self.__snapshot.highscore
 
     def get_sound_enabled(self) -> bool:
-        return self.__settings.get("sound", True)
+        return self.__snapshot.sound
+
+    def subscribe(self, key: str, listener: Callable[[Any], None]) -> None:
+        self.__listeners.setdefault(key, []).append(listener)
 
     def set(self, key: str, value: Any) -> None:
         self.__settings.set(key, value)
+        self.__refresh()
 
     def save(self) -> None:
         self.__settings.save()
 
+    def flush(self) -> None:
+        self.__settings.flush()
+
     def load(self) -> None:
         self.__settings.load()
+        self.__refresh()
+
+    def __refresh(self) -> None:
+        previous = self.__snapshot
+
+        self.__snapshot = SettingsSnapshot.read(self.__settings)
+        if self.__snapshot == previous:
+            return
+
+        self.__font = self.__font_manager.get(self.__snapshot.font)
+
+        for key, value in self.__snapshot._asdict().items():
+            if value == getattr(previous, key):
+                continue
+
+            for listener in self.__listeners.get(key, ()):
+                listener(value)
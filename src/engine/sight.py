@@ -0,0 +1,60 @@
+from array import array
+
+from engine.grid import WallGrid
+
+BLOCKED = -1
+
+
+class SightIndex:
+    def __init__(self, walls: WallGrid) -> None:
+        self.__columns = walls.columns
+        self.__rows = walls.rows
+
+        self.__row_segments = array("i", [BLOCKED]) * (self.__columns * self.__rows)
+        self.__column_segments = array("i", [BLOCKED]) * (self.__columns * self.__rows)
+
+        self.__build(walls)
+
+    def visible(self, ax: int, ay: int, bx: int, by: int, distance: int) -> bool:
+        columns = self.__columns
+
+        if not (0 <= ax < columns and 0 <= ay < self.__rows):
+            return False
+        if not (0 <= bx < columns and 0 <= by < self.__rows):
+            return False
+
+        a, b = ay * columns + ax, by * columns + bx
+
+        if ay == by:
+            return (
+                abs(ax - bx) <= distance
+                and self.__row_segments[a] == self.__row_segments[b] != BLOCKED
+            )
+
+        if ax == bx:
+            return (
+                abs(ay - by) <= distance
+                and self.__column_segments[a] == self.__column_segments[b] != BLOCKED
+            )
+
+        return False
+
+    def __build(self, walls: WallGrid) -> None:
+        columns, rows = self.__columns, self.__rows
+
+        segment = 0
+        for y in range(rows):
+            segment += 1
+            for x in range(columns):
+                if walls.is_wall(x, y):
+                    segment += 1
+                else:
+                    self.__row_segments[y * columns + x] = segment
+
+        for x in range(columns):
+            segment += 1
+            for y in range(rows):
+                if walls.is_wall(x, y):
+                    segment += 1
+                else:
+                    self.__column_segments[y * columns + x] = segment
@@ -0,0 +1,301 @@
+import os
+import random
+import time
+
+import pygame
+
+from engine.assets import assets
+from engine.audio import audio
+from engine.clock import simulation_clock
+from engine.level import Level
+from engine.replay import InputSource, Recorder, Replay, ReplayInput
+from engine.scheduler import ai_scheduler
+from engine.timestep import TICK_RATE
+from engine.ui.ui import UI
+from entities.player import Player
+
+FRAME_DURATION = 1000 / TICK_RATE
+
+DIRECTION_KEYS = {
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+}
+
+PLAYER_KEYS = {
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_w,
+    pygame.K_a,
+    pygame.K_s,
+    pygame.K_d,
+}
+
+
+class RandomInput:
+    def __init__(self, seed: int, interval: int = 30) -> None:
+        self.__random = random.Random(seed)
+        self.__interval = interval
+        self.__keys = list(DIRECTION_KEYS.values())
+
+    def __call__(self, frame: int, _: list[pygame.event.Event]) -> int | None:
+        if frame % self.__interval == 0:
+            return self.__random.choice(self.__keys)
+
+        return None
+
+
+class ScriptedInput:
+    def __init__(self, path: str) -> None:
+        self.__keys: dict[int, int] = {}
+
+        with open(path, "r") as file:
+            for line in file.read().splitlines():
+                if not line.strip() or line.startswith("#"):
+                    continue
+
+                frame, direction = line.split()
+                self.__keys[int(frame)] = DIRECTION_KEYS[direction]
+
+    def __call__(self, frame: int, _: list[pygame.event.Event]) -> int | None:
+        return self.__keys.get(frame)
+
+
+class KeyboardInput:
+    def __call__(self, _: int, events: list[pygame.event.Event]) -> int | None:
+        key = None
+
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in PLAYER_KEYS:
+                key = event.key
+
+        return key
+
+
+class Simulation:
+    def __init__(
+        self,
+        seed: int,
+        input_source: InputSource,
+        max_frames: int,
+        screen: pygame.Surface | None = None,
+    ) -> None:
+        self.__seed = seed
+        self.__input_source = input_source
+        self.__max_frames = max_frames
+
+        self.__screen = screen
+        self.__background: pygame.Surface | None = None
+
+        self.__slowest_frame = 0
+        self.__slowest_time = 0.0
+
+    @staticmethod
+    def setup(headless: bool = True) -> pygame.Surface:
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        pygame.init()
+        pygame.mixer.init()
+
+        ai_scheduler.set_budget(None)
+
+        if headless:
+            audio.set_enabled(False)
+            return pygame.display.set_mode((1, 1))
+
+        pygame.display.set_caption("Pacman")
+        return pygame.display.set_mode((800, 800))
+
+    def run(self) -> dict[str, int | float]:
+        random.seed(self.__seed)
+        simulation_clock.reset()
+        ai_scheduler.reset()
+
+        player = Player(-100, -100)
+
+        number = 1
+        level = self.__load(number, player)
+
+        clock = pygame.time.Clock()
+        font = pygame.font.Font(None, 48)
+        ui = UI()
+
+        frame = 0
+        while frame < self.__max_frames:
+            events = pygame.event.get() if self.__screen is not None else []
+            if any(event.type == pygame.QUIT for event in events):
+                break
+
+            start = time.perf_counter()
+
+            key = self.__input_source(frame, events)
+            if key is not None:
+                player.handle_keydown(key)
+
+            if player.dead() and player.time_since_death() > 3500:
+                break
+
+            if level.is_completed():
+                try:
+                    level = self.__load(number + 1, player)
+                except FileNotFoundError:
+                    break
+                number += 1
+            else:
+                level.update()
+
+            elapsed = (time.perf_counter() - start) * 1000
+            if elapsed > self.__slowest_time:
+                self.__slowest_frame, self.__slowest_time = frame, elapsed
+
+            if self.__screen is not None:
+                level.draw(self.__screen)
+                ui.display(self.__screen, font, player.score(), number, player.health())
+                pygame.display.flip()
+
+                clock.tick(60)
+
+            simulation_clock.advance(FRAME_DURATION)
+            frame += 1
+
+        return {
+            "seed": self.__seed,
+            "frames": frame,
+            "level": number,
+            "score": player.score(),
+            "health": player.health(),
+            "slowest_frame": self.__slowest_frame,
+            "slowest_ms": self.__slowest_time,
+        }
+
+    def __load(self, number: int, player: Player) -> Level:
+        level = Level(number, player)
+
+        if self.__screen is not None:
+            if self.__background is None:
+                self.__background = assets.image(
+                    "assets/images/background.jpg",
+                    self.__screen.get_size(),
+                    alpha=False,
+                )
+            level.set_background(self.__background)
+
+        return level
+
+
+DETERMINISTIC_KEYS = ("frames", "level", "score", "health")
+
+
+def run_headless(
+    games: int,
+    seed: int,
+    max_frames: int,
+    script: str | None = None,
+    record: str | None = None,
+    replay: str | None = None,
+) -> list[dict[str, int | float]]:
+    Simulation.setup()
+
+    results = []
+    start = time.perf_counter()
+
+    for game in range(games):
+        game_seed = seed + game
+        input_source, game_seed, frames = select_input(
+            game_seed, max_frames, script, replay
+        )
+        if record is not None:
+            input_source = Recorder(input_source)
+
+        result = Simulation(game_seed, input_source, frames).run()
+        results.append(result)
+
+        print(
+            f"seed {result['seed']}: level {result['level']}, "
+            f"score {result['score']}, health {result['health']}, "
+            f"{result['frames']} frames, slowest frame {result['slowest_frame']} "
+            f"({result['slowest_ms']:.2f} ms)"
+        )
+
+        finish(result, input_source, record, replay)
+
+    elapsed = time.perf_counter() - start
+    frames = sum(int(result["frames"]) for result in results)
+
+    print(
+        f"{games} games, {frames} frames in {elapsed:.2f} s "
+        f"({frames / max(elapsed, 1e-9):.0f} simulated frames/s)"
+    )
+
+    pygame.quit()
+
+    return results
+
+
+def run_realtime(
+    seed: int,
+    max_frames: int,
+    record: str | None = None,
+    replay: str | None = None,
+) -> dict[str, int | float]:
+    screen = Simulation.setup(headless=False)
+
+    if replay is not None:
+        input_source, seed, max_frames = select_input(seed, max_frames, None, replay)
+    else:
+        input_source = KeyboardInput()
+    if record is not None:
+        input_source = Recorder(input_source)
+
+    result = Simulation(seed, input_source, max_frames, screen).run()
+
+    print(
+        f"seed {result['seed']}: level {result['level']}, "
+        f"score {result['score']}, {result['frames']} frames"
+    )
+
+    finish(result, input_source, record, replay)
+
+    pygame.quit()
+
+    return result
+
+
+def select_input(
+    seed: int, max_frames: int, script: str | None, replay: str | None
+) -> tuple[InputSource, int, int]:
+    if replay is not None:
+        recorded = Replay.load(replay)
+        return ReplayInput(recorded), recorded.seed, recorded.frames
+
+    if script is not None:
+        return ScriptedInput(script), seed, max_frames
+
+    return RandomInput(seed), seed, max_frames
+
+
+def finish(
+    result: dict[str, int | float],
+    input_source: InputSource,
+    record: str | None,
+    replay: str | None,
+) -> None:
+    summary = {key: result[key] for key in DETERMINISTIC_KEYS}
+
+    if record is not None and isinstance(input_source, Recorder):
+        input_source.replay(int(result["seed"]), summary).save(record)
+
+    if replay is not None:
+        expected = Replay.load(replay).result
+        if not expected:
+            return
+
+        if expected == summary:
+            print("replay matches the recording")
+        else:
+            print(f"replay diverged: expected {expected}, got {summary}")
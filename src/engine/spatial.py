@@ -0,0 +1,51 @@
+from typing import Container, Generic, Hashable, Iterator, TypeVar
+
+import pygame
+
+T = TypeVar("T", bound=Hashable)
+
+
+class ChunkIndex(Generic[T]):
+    def __init__(self, size: int) -> None:
+        self.__size = size
+
+        self.__chunks: dict[tuple[int, int], dict[T, None]] = {}
+        self.__positions: dict[T, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def move(self, item: T, x: int, y: int) -> None:
+        chunk = x // self.__size, y // self.__size
+
+        previous = self.__positions.get(item)
+        if previous == chunk:
+            return
+
+        if previous is not None:
+            del self.__chunks[previous][item]
+
+        self.__chunks.setdefault(chunk, {})[item] = None
+        self.__positions[item] = chunk
+
+    def remove(self, item: T) -> None:
+        chunk = self.__positions.pop(item, None)
+        if chunk is not None:
+            del self.__chunks[chunk][item]
+
+    def retain(self, items: Container) -> None:
+        for item in [item for item in self.__positions if item not in items]:
+            self.remove(item)
+
+    def clear(self) -> None:
+        self.__chunks.clear()
+        self.__positions.clear()
+
+    def query(self, rect: pygame.Rect) -> Iterator[T]:
+        size = self.__size
+
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                chunk = self.__chunks.get((cx, cy))
+                if chunk:
+                    yield from chunk
@@ -0,0 +1,35 @@
+import time
+
+
+class StartupTimer:
+    def __init__(self) -> None:
+        self.__start = time.perf_counter()
+        self.__last = self.__start
+
+        self.__marks: dict[str, float] = {}
+        self.__is_enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.__is_enabled
+
+    def enable(self) -> None:
+        self.__is_enabled = True
+
+    def mark(self, name: str) -> None:
+        if name in self.__marks:
+            return
+
+        now = time.perf_counter()
+        self.__marks[name] = (now - self.__last) * 1000
+        self.__last = now
+
+    def report(self) -> dict[str, float]:
+        return {**self.__marks, "total": (self.__last - self.__start) * 1000}
+
+    def print_report(self) -> None:
+        for name, milliseconds in self.report().items():
+            print(f"{name:>12} {milliseconds:8.1f} ms")
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,289 @@
+import os
+import socket
+import stat
+import struct
+from typing import NamedTuple
+
+from engine.level import Level
+from entities.player import Player
+
+MESSAGE = struct.Struct("<I")
+HEADER = struct.Struct("<IBB")
+LEVEL = struct.Struct("<H")
+SCORE = struct.Struct("<i")
+HEALTH = struct.Struct("<b")
+RECT = struct.Struct("<hhhh")
+COUNTS = struct.Struct("<HH")
+GHOST = struct.Struct("<Hhh")
+CELLS = struct.Struct("<H")
+CELL = struct.Struct("<HH")
+
+KEYFRAME, RESET_EATEN = 1, 2
+HAS_LEVEL, HAS_SCORE, HAS_HEALTH = 1, 2, 4
+HAS_PLAYER, HAS_GHOSTS, HAS_EATEN = 8, 16, 32
+
+MAX_CELLS = 0xFFFF
+
+
+class Snapshot(NamedTuple):
+    tick: int = 0
+    level: int = 0
+    score: int = 0
+    health: int = 0
+    player: tuple[int, int, int, int] = (0, 0, 0, 0)
+    ghosts: tuple[tuple[int, int], ...] = ()
+
+
+def encode(
+    previous: Snapshot | None,
+    current: Snapshot,
+    eaten: list[tuple[int, int]],
+    reset_eaten: bool = False,
+) -> bytes:
+    flags = (KEYFRAME if previous is None else 0) | (RESET_EATEN if reset_eaten else 0)
+    base = previous or Snapshot()
+
+    mask = 0
+    fields = []
+
+    if previous is None or current.level != base.level:
+        mask |= HAS_LEVEL
+        fields.append(LEVEL.pack(current.level))
+
+    if previous is None or current.score != base.score:
+        mask |= HAS_SCORE
+        fields.append(SCORE.pack(current.score))
+
+    if previous is None or current.health != base.health:
+        mask |= HAS_HEALTH
+        fields.append(HEALTH.pack(current.health))
+
+    if previous is None or current.player != base.player:
+        mask |= HAS_PLAYER
+        fields.append(RECT.pack(*current.player))
+
+    if previous is None or current.ghosts != base.ghosts:
+        changed = [
+            GHOST.pack(index, x, y)
+            for index, (x, y) in enumerate(current.ghosts)
+            if index >= len(base.ghosts) or base.ghosts[index] != (x, y)
+        ]
+        mask |= HAS_GHOSTS
+        fields.append(COUNTS.pack(len(current.ghosts), len(changed)))
+        fields.extend(changed)
+
+    if eaten:
+        mask |= HAS_EATEN
+        fields.append(CELLS.pack(len(eaten)))
+        fields.extend(CELL.pack(x, y) for x, y in eaten)
+
+    body = HEADER.pack(current.tick, flags, mask) + b"".join(fields)
+
+    return MESSAGE.pack(len(body)) + body
+
+
+class SpectatorState:
+    def __init__(self) -> None:
+        self.snapshot = Snapshot()
+        self.eaten: set[tuple[int, int]] = set()
+
+    def apply(self, body: bytes) -> Snapshot:
+        tick, flags, mask = HEADER.unpack_from(body)
+        offset = HEADER.size
+
+        snapshot = Snapshot() if flags & KEYFRAME else self.snapshot
+        if flags & (KEYFRAME | RESET_EATEN):
+            self.eaten.clear()
+
+        level, score, health, player, ghosts = snapshot[1:]
+
+        if mask & HAS_LEVEL:
+            (level,) = LEVEL.unpack_from(body, offset)
+            offset += LEVEL.size
+
+        if mask & HAS_SCORE:
+            (score,) = SCORE.unpack_from(body, offset)
+            offset += SCORE.size
+
+        if mask & HAS_HEALTH:
+            (health,) = HEALTH.unpack_from(body, offset)
+            offset += HEALTH.size
+
+        if mask & HAS_PLAYER:
+            player = RECT.unpack_from(body, offset)
+            offset += RECT.size
+
+        if mask & HAS_GHOSTS:
+            count, changes = COUNTS.unpack_from(body, offset)
+            offset += COUNTS.size
+
+            positions = list(ghosts[:count]) + [(0, 0)] * (count - len(ghosts))
+            for index, x, y in GHOST.iter_unpack(
+                body[offset : offset + changes * GHOST.size]
+            ):
+                positions[index] = x, y
+            offset += changes * GHOST.size
+
+            ghosts = tuple(positions)
+
+        if mask & HAS_EATEN:
+            (cells,) = CELLS.unpack_from(body, offset)
+            offset += CELLS.size
+
+            self.eaten.update(
+                CELL.iter_unpack(body[offset : offset + cells * CELL.size])
+            )
+
+        self.snapshot = Snapshot(tick, level, score, health, player, ghosts)
+
+        return self.snapshot
+
+
+class Subscriber:
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection = connection
+        self.pending = bytearray()
+
+        self.snapshot: Snapshot | None = None
+        self.generation = -1
+        self.eaten = 0
+
+
+class TelemetryPublisher:
+    def __init__(self, address: str, max_clients: int = 8) -> None:
+        self.__max_clients = max_clients
+
+        self.__path: str | None = None
+
+        if ":" in address:
+            host, port = address.rsplit(":", 1)
+            self.__server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.__server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.__server.bind((host, int(port)))
+        else:
+            if os.path.exists(address):
+                if not stat.S_ISSOCK(os.stat(address).st_mode):
+                    raise FileExistsError(f"{address} exists and is not a socket")
+                os.unlink(address)
+            self.__path = address
+            self.__server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__server.bind(address)
+
+        self.__server.listen(max_clients)
+        self.__server.setblocking(False)
+
+        self.__subscribers: list[Subscriber] = []
+
+        self.__tick = 0
+        self.__eaten: list[tuple[int, int]] | None = None
+        self.__generation = 0
+
+        self.__sent = 0
+        self.__dropped = 0
+        self.__bytes = 0
+
+    @property
+    def address(self) -> str:
+        if self.__path is not None:
+            return self.__path
+
+        host, port = self.__server.getsockname()
+        return f"{host}:{port}"
+
+    def publish(self, level: Level, player: Player) -> None:
+        self.__tick += 1
+        self.__accept()
+
+        if not self.__subscribers:
+            return
+
+        eaten = level.eaten
+        if eaten is not self.__eaten:
+            self.__eaten = eaten
+            self.__generation += 1
+
+        snapshot = Snapshot(
+            self.__tick,
+            level.number,
+            player.score(),
+            player.health(),
+            (player.rect.x, player.rect.y, player.rect.w, player.rect.h),
+            tuple(ghost.rect.topleft for ghost in level.ghosts.sprites()),
+        )
+
+        for subscriber in list(self.__subscribers):
+            if not self.__flush(subscriber):
+                continue
+
+            if subscriber.pending:
+                self.__dropped += 1
+                continue
+
+            reset_eaten = subscriber.generation != self.__generation
+            if reset_eaten:
+                subscriber.generation = self.__generation
+                subscriber.eaten = 0
+
+            cells = eaten[subscriber.eaten : subscriber.eaten + MAX_CELLS]
+            subscriber.eaten += len(cells)
+
+            message = encode(subscriber.snapshot, snapshot, cells, reset_eaten)
+            subscriber.snapshot = snapshot
+            subscriber.pending += message
+
+            self.__sent += 1
+            self.__bytes += len(message)
+
+            self.__flush(subscriber)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "clients": len(self.__subscribers),
+            "sent": self.__sent,
+            "dropped": self.__dropped,
+            "bytes": self.__bytes,
+        }
+
+    def shutdown(self) -> None:
+        for subscriber in self.__subscribers:
+            subscriber.connection.close()
+        self.__subscribers.clear()
+
+        self.__server.close()
+
+        if self.__path is not None and os.path.exists(self.__path):
+            os.unlink(self.__path)
+
+    def __accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self.__server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+
+            if len(self.__subscribers) >= self.__max_clients:
+                connection.close()
+                continue
+
+            connection.setblocking(False)
+            if connection.family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            self.__subscribers.append(Subscriber(connection))
+
+    def __flush(self, subscriber: Subscriber) -> bool:
+        if not subscriber.pending:
+            return True
+
+        try:
+            sent = subscriber.connection.send(subscriber.pending)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            subscriber.connection.close()
+            self.__subscribers.remove(subscriber)
+            return False
+
+        del subscriber.pending[:sent]
+
+        return True
@@ -0,0 +1,38 @@
+TICK_RATE = 60
+
+
+class FixedTimestep:
+    def __init__(self, rate: int = TICK_RATE, max_steps: int = 5) -> None:
+        self.__step = 1000 / rate
+        self.__max_steps = max_steps
+
+        self.__accumulator = 0.0
+
+        self.__skipped = 0
+
+    @property
+    def step(self) -> float:
+        return self.__step
+
+    @property
+    def alpha(self) -> float:
+        return self.__accumulator / self.__step
+
+    @property
+    def skipped(self) -> int:
+        return self.__skipped
+
+    def accumulate(self, milliseconds: float) -> None:
+        self.__accumulator += milliseconds
+
+        limit = self.__step * self.__max_steps
+        if self.__accumulator > limit:
+            self.__skipped += int((self.__accumulator - limit) // self.__step)
+            self.__accumulator = limit
+
+    def steps(self) -> int:
+        count = int(self.__accumulator // self.__step)
+
+        self.__accumulator -= count * self.__step
+
+        return count
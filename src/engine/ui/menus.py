@@ -3,6 +3,7 @@ from enum import IntEnum
 import pygame
 
 from engine.settings import SettingsManager
+from engine.ui.text import text_cache
 
 
 class MenuOption:
@@ -71,7 +72,7 @@ class BaseMenu(pygame.sprite.Sprite):
         self.__selected = (self.__selected + value) % len(self.__options)
 
     def draw_title(self, screen: pygame.Surface, width: int, height: int) -> None:
-        title_surface = self.__font.render(self.__title, True, self.__title_color)
+        title_surface = text_cache.render(self.__font, self.__title, self.__title_color)
 
         title_rect = title_surface.get_rect()
         title_rect.center = width // 2, height // 2
@@ -82,7 +83,7 @@ class BaseMenu(pygame.sprite.Sprite):
         for i, option in enumerate(self.__options):
             color = self.__selected_color if i == self.__selected else self.__text_color
 
-            option_surface = self.__font.render(str(option), True, color)
+            option_surface = text_cache.render(self.__font, str(option), color)
 
             option_rect = option_surface.get_rect()
             option_rect.center = width // 2, (i + 1) * height
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+import pygame
+
+Color = str | tuple[int, int, int] | tuple[int, int, int, int]
+
+
+class TextCache:
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.__max_bytes = max_bytes
+        self.__surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        self.__bytes = 0
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Color,
+        antialias: bool = True,
+        background: Color | None = None,
+    ) -> pygame.Surface:
+        key = (font, text, color, antialias, background)
+
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__hits += 1
+            self.__surfaces.move_to_end(key)
+            return surface
+
+        self.__misses += 1
+
+        surface = font.render(text, antialias, color, background)
+
+        self.__surfaces[key] = surface
+        self.__bytes += self.__size(surface)
+
+        while self.__bytes > self.__max_bytes and len(self.__surfaces) > 1:
+            _, evicted = self.__surfaces.popitem(last=False)
+            self.__bytes -= self.__size(evicted)
+            self.__evictions += 1
+
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.__hits + self.__misses
+        return self.__hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "entries": len(self.__surfaces),
+            "bytes": self.__bytes,
+        }
+
+    def clear(self) -> None:
+        self.__surfaces.clear()
+        self.__bytes = 0
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @staticmethod
+    def __size(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+
+text_cache = TextCache()
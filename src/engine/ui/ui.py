@@ -1,10 +1,13 @@
 import pygame
 
+from engine.assets import assets
+from engine.render import Layer, RenderQueue
+from engine.ui.text import text_cache
+
 
 class UI:
     def __init__(self) -> None:
-        self.__heart_image = pygame.image.load("assets/images/heart.png")
-        self.__heart_image = pygame.transform.scale(self.__heart_image, (64, 64))
+        self.__heart_image: pygame.Surface | None = None
 
     def display(
         self,
@@ -14,22 +17,38 @@ class UI:
         level: int,
         health: int,
     ) -> None:
-        self.__display_score(screen, font, score)
-        self.__display_level(screen, font, level)
-        self.__display_health(screen, health)
+        queue = RenderQueue()
+        self.render(queue, font, score, level, health)
+        queue.flush(screen)
+
+    def render(
+        self,
+        queue: RenderQueue,
+        font: pygame.font.Font,
+        score: int,
+        level: int,
+        health: int,
+    ) -> None:
+        self.__display_score(queue, font, score)
+        self.__display_level(queue, font, level)
+        self.__display_health(queue, health)
 
     def __display_score(
-        self, screen: pygame.Surface, font: pygame.font.Font, score: int
+        self, queue: RenderQueue, font: pygame.font.Font, score: int
     ) -> None:
-        score_text = font.render(f"Score: {score}", True, "white")
-        screen.blit(score_text, [0, 30])
+        score_text = text_cache.render(font, f"Score: {score}", "white")
+        queue.push(score_text, (0, 30), Layer.UI)
 
     def __display_level(
-        self, screen: pygame.Surface, font: pygame.font.Font, level: int
+        self, queue: RenderQueue, font: pygame.font.Font, level: int
     ) -> None:
-        level_text = font.render(f"Level: {level}", True, "white")
-        screen.blit(level_text, [0, 60])
+        level_text = text_cache.render(font, f"Level: {level}", "white")
+        queue.push(level_text, (0, 60), Layer.UI)
+
+    def __display_health(self, queue: RenderQueue, health: int) -> None:
+        if self.__heart_image is None:
+            self.__heart_image = assets.image("assets/images/heart.png", (64, 64))
 
-    def __display_health(self, screen: pygame.Surface, health: int) -> None:
-        for i in range(health):
-            screen.blit(self.__heart_image, [i * 32, -10])
+        queue.extend(
+            [(self.__heart_image, (i * 32, -10)) for i in range(health)], Layer.UI
+        )
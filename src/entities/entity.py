@@ -1,70 +1,64 @@
 import pygame
 
+from engine.assets import assets
+from engine.render import Blit
+
 
 class Entity(pygame.sprite.Sprite):
+    __slots__ = ("image", "rect", "__size", "__tag")
+
     image: pygame.Surface
     rect: pygame.Rect
 
     def __init__(self, x: int, y: int, size: int, tag: str, *groups) -> None:
         super().__init__(*groups)
 
-        self.__x = x
-        self.__y = y
         self.__size = size
         self.__tag = tag
 
+        self.rect = pygame.Rect(x, y, size, size)
+
     @property
     def size(self) -> int:
         return self.__size
 
-    @classmethod
-    def from_image(cls, x: int, y: int, size: int, image_path: str, tag: str, *groups):
-        entity = cls(x, y, size, tag, *groups)
-
-        entity.image = pygame.image.load(image_path).convert_alpha()
-        entity.image = pygame.transform.scale(
-            entity.image, (entity.__size, entity.__size)
-        )
-        entity.rect = entity.image.get_rect(topleft=[entity.__x, entity.__y])
-
-        return entity
-
-    @classmethod
-    def from_color(cls, x: int, y: int, size: int, color: str, tag: str, *groups):
-        entity = cls(x, y, size, tag, *groups)
-        entity.image = pygame.Surface(
-            [entity.__size, entity.__size], pygame.SRCALPHA, 32
-        ).convert_alpha()
-
-        pygame.draw.circle(
-            entity.image,
-            color,
-            (entity.__size // 2, entity.__size // 2),
-            entity.__size // 2,
-        )
-        entity.rect = entity.image.get_rect(topleft=[entity.__x, entity.__y])
+    def set_image(self, image: pygame.Surface) -> None:
+        self.image = image
+        self.rect = image.get_rect(topleft=self.rect.topleft)
 
-        return entity
+    def draw(
+        self,
+        screen: pygame.Surface,
+        offset: tuple[int, int] = (0, 0),
+        alpha: float = 1.0,
+    ) -> None:
+        blit = self.render(offset, alpha)
+        if blit is not None:
+            screen.blit(*blit)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        screen.blit(self.image, self.rect)
+    def render(
+        self, offset: tuple[int, int] = (0, 0), alpha: float = 1.0
+    ) -> Blit | None:
+        return self.image, self.rect.move(offset)
 
     def __str__(self) -> str:
         return self.__tag
 
-    def update(self, _: pygame.sprite.Group) -> None:
-        ...
+    def update(self, _: pygame.sprite.Group) -> None: ...
 
 
 class MovableEntity(Entity):
+    __slots__ = ("__speed", "__direction", "__previous")
+
     def __init__(
         self, x: int, y: int, size: int, speed: int, image_path: str, tag: str, *groups
     ) -> None:
-        entity = Entity.from_image(x, y, size, image_path, tag, *groups)
-        self.__dict__.update(entity.__dict__)
+        super().__init__(x, y, size, tag, *groups)
+        self.set_image(assets.image(image_path, (size, size)))
 
         self.__speed = speed
         self.__direction = pygame.math.Vector2(0, 0)
+        self.__previous = self.rect.topleft
 
     @property
     def direction(self) -> pygame.math.Vector2:
@@ -77,25 +71,54 @@ class MovableEntity(Entity):
     def update(self, group: pygame.sprite.Group) -> None:
         self.move(group)
 
+    def render(
+        self, offset: tuple[int, int] = (0, 0), alpha: float = 1.0
+    ) -> Blit | None:
+        x, y = self.interpolate(alpha)
+        return self.image, (x + offset[0], y + offset[1])
+
+    def store_position(self) -> None:
+        self.__previous = self.rect.topleft
+
+    def interpolate(self, alpha: float) -> tuple[int, int]:
+        (previous_x, previous_y), (x, y) = self.__previous, self.rect.topleft
+
+        dx, dy = x - previous_x, y - previous_y
+        if not dx and not dy:
+            return x, y
+
+        speed = self.__speed
+        if not (-speed <= dx <= speed and -speed <= dy <= speed):
+            return x, y
+
+        return previous_x + int(dx * alpha), previous_y + int(dy * alpha)
+
     def move(self, group: pygame.sprite.Group) -> None:
         new_position = self.rect.move(self.__direction * self.__speed)
 
         if not self.check_collision(new_position, group):
             self.rect = new_position
 
-        self.wrap_around()
+        self.wrap_around(group)
 
-    def check_collision(self, rect: pygame.Rect, group: pygame.sprite.Group) -> bool:
-        for entity in group.sprites():
-            if str(entity) == "wall":
-                if rect.colliderect(entity.rect):
-                    return True
+    def can_move(self, dx: int, dy: int, group: pygame.sprite.Group) -> bool:
+        if not hasattr(group, "walls"):
+            return True
 
-        return False
+        return not group.walls.collides(
+            self.rect.move(dx * self.__speed, dy * self.__speed)
+        )
+
+    def check_collision(self, rect: pygame.Rect, group: pygame.sprite.Group) -> bool:
+        return hasattr(group, "walls") and group.walls.collides(rect)
 
-    def wrap_around(self) -> None:
+    def wrap_around(self, group: pygame.sprite.Group | None = None) -> None:
         gap = 10
-        screen_width, screen_height = pygame.display.get_surface().get_size()
+
+        if group is not None and hasattr(group, "size"):
+            screen_width, screen_height = group.size
+        else:
+            screen_width, screen_height = pygame.display.get_surface().get_size()
 
         if self.rect.left > screen_width - gap:
             self.rect.right = gap
@@ -1,30 +1,67 @@
 import random
-from entities.entity import Entity
 
+import pygame
 
-class Food(Entity):
-    def __init__(self, x: int, y: int, tag: str = "food", *groups) -> None:
-        self.points = random.randint(1, 10)
+from engine.assets import assets
+from engine.grid import TILE_SIZE
 
-        image_path = None
 
-        match tag:
-            case "cherry":
-                image_path = "assets/images/cherry.png"
-                tag = "cherry"
-                self.points = 100
-            case "blueberry":
-                image_path = "assets/images/blueberry.png"
-                tag = "blueberry"
-                self.points = 300
-            case _:
-                tag = "food"
+class FoodKind:
+    def __init__(
+        self,
+        tag: str,
+        size: int,
+        offset: int,
+        points: int | None = None,
+        image_path: str | None = None,
+        color: str = "yellow",
+    ) -> None:
+        self.__tag = tag
+        self.__size = size
+        self.__offset = offset
+        self.__points = points
+        self.__image_path = image_path
+        self.__color = color
 
-        if image_path is not None:
-            entity = Entity.from_image(x * 40, y * 40, 32, image_path, tag, *groups)
+        self.__image: pygame.Surface | None = None
+
+    @property
+    def tag(self) -> str:
+        return self.__tag
+
+    def points(self) -> int:
+        if self.__points is None:
+            return random.randint(1, 10)
+
+        return self.__points
+
+    def rect(self, x: int, y: int) -> pygame.Rect:
+        return pygame.Rect(
+            x * TILE_SIZE + self.__offset,
+            y * TILE_SIZE + self.__offset,
+            self.__size,
+            self.__size,
+        )
+
+    def image(self) -> pygame.Surface:
+        if self.__image is not None:
+            return self.__image
+
+        if self.__image_path is not None:
+            self.__image = assets.image(self.__image_path, (self.__size, self.__size))
         else:
-            entity = Entity.from_color(
-                x * 40 + 16, y * 40 + 16, 16, "yellow", tag, *groups
-            )
+            self.__image = assets.circle(self.__size, self.__color)
+
+        return self.__image
+
+    def __str__(self) -> str:
+        return self.__tag
+
+
+FOOD_KINDS = (
+    FoodKind("food", 16, 16),
+    FoodKind("cherry", 32, 0, 100, "assets/images/cherry.png"),
+    FoodKind("blueberry", 32, 0, 300, "assets/images/blueberry.png"),
+)
 
-        self.__dict__.update(entity.__dict__)
+FOOD_TILES = {"*": 1, "C": 2, "B": 3}
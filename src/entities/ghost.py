@@ -3,10 +3,17 @@ import random
 import pygame
 
 
+from engine.clock import simulation_clock
+from engine.grid import TILE_SIZE
+from engine.navigation import FlowField
 from entities.entity import Entity, MovableEntity
 
+PURSUIT_DURATION = 3000
+
 
 class Ghost(MovableEntity):
+    __slots__ = ("__pursuit_end_time",)
+
     def __init__(
         self,
         x: int,
@@ -18,7 +25,13 @@ class Ghost(MovableEntity):
             x * 40, y * 40, 32, speed, "assets/images/ghost.png", "ghost", *groups
         )
 
-    def move(self, group: pygame.sprite.Group) -> None:
+        self.__pursuit_end_time = -1
+
+    def update(self, group: pygame.sprite.Group) -> None:
+        self.plan(group)
+        self.move(group)
+
+    def plan(self, group: pygame.sprite.Group) -> None:
         if random.random() < 0.01:
             dx, dy = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
             self.change_direction(dx, dy)
@@ -31,18 +44,73 @@ class Ghost(MovableEntity):
         if not isinstance(player, Entity):
             return
 
-        if self.is_player_is_sight(player):
-            dx, dy = player.rect.x - self.rect.x, player.rect.y - self.rect.y
+        if self.is_player_is_sight(player, group):
+            self.__pursuit_end_time = simulation_clock.get_ticks() + PURSUIT_DURATION
+        elif simulation_clock.get_ticks() > self.__pursuit_end_time:
+            return
+
+        if hasattr(group, "navigation"):
+            self.follow(group.navigation, player, group)
+        else:
+            self.chase(player)
 
-            if abs(dx) > abs(dy):
-                self.change_direction(1 if dx > 0 else -1, 0)
-            else:
-                self.change_direction(0, 1 if dy > 0 else -1)
+    def move(self, group: pygame.sprite.Group) -> None:
+        position = self.rect.topleft
 
         super().move(group)
 
-    def is_player_is_sight(self, entity: Entity) -> None:
+        if self.rect.topleft == position and hasattr(group, "walls"):
+            self.turn(group)
+
+    def chase(self, entity: Entity) -> None:
+        dx, dy = entity.rect.x - self.rect.x, entity.rect.y - self.rect.y
+
+        if abs(dx) > abs(dy):
+            self.change_direction(1 if dx > 0 else -1, 0)
+        else:
+            self.change_direction(0, 1 if dy > 0 else -1)
+
+    def follow(
+        self, navigation: FlowField, target: Entity, group: pygame.sprite.Group
+    ) -> None:
+        x, y = self.rect.centerx // TILE_SIZE, self.rect.centery // TILE_SIZE
+        dx, dy = navigation.direction(x, y)
+
+        if dx == 0 and dy == 0:
+            return self.chase(target)
+
+        if self.can_move(dx, dy, group):
+            return self.change_direction(dx, dy)
+
+        if dx != 0:
+            offset = y * TILE_SIZE + (TILE_SIZE - self.rect.height) // 2 - self.rect.y
+            self.change_direction(0, (offset > 0) - (offset < 0))
+        else:
+            offset = x * TILE_SIZE + (TILE_SIZE - self.rect.width) // 2 - self.rect.x
+            self.change_direction((offset > 0) - (offset < 0), 0)
+
+    def turn(self, group: pygame.sprite.Group) -> None:
+        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        random.shuffle(directions)
+
+        for dx, dy in directions:
+            if self.can_move(dx, dy, group):
+                return self.change_direction(dx, dy)
+
+    def is_player_is_sight(
+        self, entity: Entity, group: pygame.sprite.Group | None = None
+    ) -> bool:
         sight_distance = 100 * self.speed
+
+        if group is not None and hasattr(group, "sight"):
+            return group.sight.visible(
+                self.rect.centerx // TILE_SIZE,
+                self.rect.centery // TILE_SIZE,
+                entity.rect.centerx // TILE_SIZE,
+                entity.rect.centery // TILE_SIZE,
+                sight_distance // TILE_SIZE,
+            )
+
         sight_rect = self.rect.inflate(sight_distance, sight_distance)
 
         if self.direction.x > 0:
@@ -1,10 +1,37 @@
 import pygame
 from engine.animation import Animation
+from engine.audio import audio
+from engine.clock import simulation_clock
+from engine.render import Blit
 
-from entities.entity import MovableEntity, Entity
+from entities.entity import MovableEntity
 
 
 class Player(MovableEntity):
+    __slots__ = (
+        "__image_idle",
+        "__animation",
+        "__rotations",
+        "__score",
+        "__max_health",
+        "__immunity_duration",
+        "__ability_duration",
+        "__blink_duration",
+        "__health",
+        "__is_dead",
+        "__death_time",
+        "__immunity",
+        "__immunity_end_time",
+        "__ability",
+        "__ability_end_time",
+        "__visible",
+        "__blink_end_time",
+        "__turn_buffer_duration",
+        "__turn",
+        "__turn_end_time",
+        "__turns",
+    )
+
     def __init__(self, x: int, y: int, *groups) -> None:
         super().__init__(x, y, 32, 3, "assets/images/pacman.png", "player", *groups)
 
@@ -21,33 +48,25 @@ class Player(MovableEntity):
             (self.size, self.size),
         )
 
+        self.__rotations = self.__build_rotations()
+
         self.rect = self.image.get_rect()
 
         self.__score = 0
 
-        self.__is_dead = False
-        self.__death_time = 0
-
         self.__max_health = 3
-        self.__health = self.__max_health
-
         self.__immunity_duration = 3000
-        self.__immunity_end_time = 0
-
-        self.__immunity = False
-
-        self.__ability = False
-
         self.__ability_duration = 3000
-        self.__ability_end_time = 0
-
         self.__blink_duration = 200
-        self.__blink_end_time = 0
+        self.__turn_buffer_duration = 300
+
         self.__visible = True
+        self.__blink_end_time = 0
 
-        self.death_sound = pygame.mixer.Sound("assets/sounds/pacman_death.wav")
-        self.chomp_sound = pygame.mixer.Sound("assets/sounds/pacman_chomp.wav")
-        self.eatfruit_sound = pygame.mixer.Sound("assets/sounds/pacman_eatfruit.wav")
+        self.__turns = 0
+        self.__turn: tuple[int, int] | None = None
+
+        self.__reset()
 
     def score(self) -> int:
         return self.__score
@@ -59,13 +78,26 @@ class Player(MovableEntity):
         return self.__is_dead
 
     def time_since_death(self) -> int:
-        return pygame.time.get_ticks() - self.__death_time
+        return simulation_clock.get_ticks() - self.__death_time
+
+    def turns(self) -> int:
+        return self.__turns
+
+    def turn_pending(self) -> bool:
+        return self.__turn is not None
 
-    def draw(self, screen: pygame.Surface) -> None:
-        if self.__visible:
-            screen.blit(self.image, self.rect.topleft)
+    def render(
+        self, offset: tuple[int, int] = (0, 0), alpha: float = 1.0
+    ) -> Blit | None:
+        if not self.__visible:
+            return None
+
+        return super().render(offset, alpha)
 
     def update(self, group: pygame.sprite.Group) -> None:
+        if not self.__is_dead:
+            self.apply_turn(group)
+
         self.animate()
 
         if not self.__is_dead:
@@ -89,21 +121,39 @@ class Player(MovableEntity):
         self.image = self.__animation.get_current_frame("walk")
 
     def rotate(self) -> pygame.Surface:
-        angle = self.direction.angle_to(pygame.math.Vector2(1, 0))
-        return pygame.transform.rotate(self.image, angle)
+        return self.__rotations[
+            self.image, int(self.direction.x), int(self.direction.y)
+        ]
+
+    def __build_rotations(
+        self,
+    ) -> dict[tuple[pygame.Surface, int, int], pygame.Surface]:
+        rotations = {}
+
+        frames = [self.__image_idle, *self.__animation.animations["walk"]]
+        directions = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
+
+        for frame in frames:
+            for x, y in directions:
+                angle = pygame.math.Vector2(x, y).angle_to(pygame.math.Vector2(1, 0))
+                rotations[frame, x, y] = pygame.transform.rotate(frame, angle)
+
+        return rotations
 
     def blink(self) -> None:
         self.check_immunity()
 
         if self.__immunity:
-            if pygame.time.get_ticks() > self.__blink_end_time:
+            if simulation_clock.get_ticks() > self.__blink_end_time:
                 self.__visible = not self.__visible
-                self.__blink_end_time = pygame.time.get_ticks() + self.__blink_duration
+                self.__blink_end_time = (
+                    simulation_clock.get_ticks() + self.__blink_duration
+                )
         else:
             self.__visible = True
 
     def animate_explosion(self) -> None:
-        current_time = pygame.time.get_ticks()
+        current_time = simulation_clock.get_ticks()
 
         elapsed_time = current_time - self.__death_time
         frame_delay = 3000 // len(self.__animation.animations["explosion"])
@@ -120,49 +170,70 @@ class Player(MovableEntity):
         if (self.__animation.current_frames["explosion"] + 1) == len(
             self.__animation.animations["explosion"]
         ):
-            self.death_sound.stop()
+            audio.stop("death")
             self.kill()
 
     def die(self) -> None:
-        self.death_sound.play()
+        audio.play("death")
         self.__is_dead = True
-        self.__death_time = pygame.time.get_ticks()
+        self.__death_time = simulation_clock.get_ticks()
+        self.__turn = None
         self.change_direction(0, 0)
 
-    def eat_food(self, food: Entity) -> None:
-        match str(food):
+    def eat_food(self, tag: str, points: int) -> None:
+        match tag:
             case "cherry":
                 self.increase_health()
-                self.eatfruit_sound.play()
+                audio.play("eatfruit")
             case "blueberry":
                 self.give_immunity()
                 self.give_ability()
-                self.eatfruit_sound.play()
+                audio.play("eatfruit")
             case _:
-                self.chomp_sound.play()
+                audio.play("chomp")
                 ...
 
-        self.__score += food.points
+        self.__score += points
 
     def respawn(self, x: int, y: int) -> None:
-        dump_score = self.__score
+        self.__reset()
 
-        self.__init__(x, y)
+        self.rect.topleft = (x, y)
 
-        self.__score = dump_score
+    def __reset(self) -> None:
+        self.__is_dead = False
+        self.__death_time = 0
 
-        self.rect.topleft = (x, y)
+        self.__health = self.__max_health
+
+        self.__immunity_end_time = 0
+        self.__immunity = False
+
+        self.__ability = False
+        self.__ability_end_time = 0
+
+        self.__blink_end_time = 0
+        self.__visible = True
+
+        self.__turn = None
+        self.__turn_end_time = 0
+
+        self.__animation.reset()
+        self.image = self.__image_idle
+        self.change_direction(0, 0)
 
     def increase_health(self) -> None:
         self.__health = min(self.__health + 1, self.__max_health)
 
     def give_ability(self) -> None:
         self.__ability = True
-        self.__ability_end_time = pygame.time.get_ticks() + self.__ability_duration
+        self.__ability_end_time = simulation_clock.get_ticks() + self.__ability_duration
 
     def give_immunity(self) -> None:
         self.__immunity = True
-        self.__immunity_end_time = pygame.time.get_ticks() + self.__immunity_duration
+        self.__immunity_end_time = (
+            simulation_clock.get_ticks() + self.__immunity_duration
+        )
 
     def take_damage(self) -> None:
         if not self.__immunity:
@@ -173,42 +244,63 @@ class Player(MovableEntity):
             self.die()
 
     def check_collision(self, rect: pygame.Rect, group: pygame.sprite.Group) -> bool:
-        for entity in group.sprites():
-            if self.rect.colliderect(entity.rect):
-                match str(entity):
-                    case "ghost":
-                        self.take_damage()
-                        if self.__ability:
-                            entity.kill()
-                            self.__score += 1000
-                            self.__ability = False
-                    case "food" | "cherry" | "blueberry":
-                        self.eat_food(entity)
-                        entity.kill()
+        if hasattr(group, "ghosts"):
+            for ghost in pygame.sprite.spritecollide(self, group.ghosts, False):
+                self.take_damage()
+                if self.__ability:
+                    ghost.kill()
+                    self.__score += 1000
+                    self.__ability = False
+
+        if hasattr(group, "eat"):
+            for tag, points in group.eat(self.rect):
+                self.eat_food(tag, points)
 
         return super().check_collision(rect, group)
 
     def check_immunity(self) -> None:
-        if self.__immunity and pygame.time.get_ticks() > self.__immunity_end_time:
+        if self.__immunity and simulation_clock.get_ticks() > self.__immunity_end_time:
             self.__immunity = False
 
-    def handle_keydown(self, key: int) -> None:
+    def handle_keydown(self, key: int) -> bool:
         match key:
             case pygame.K_UP | pygame.K_w:
-                self.change_direction(0, -1)
+                return self.request_turn(0, -1)
             case pygame.K_DOWN | pygame.K_s:
-                self.change_direction(0, 1)
+                return self.request_turn(0, 1)
             case pygame.K_LEFT | pygame.K_a:
-                self.change_direction(-1, 0)
+                return self.request_turn(-1, 0)
             case pygame.K_RIGHT | pygame.K_d:
-                self.change_direction(1, 0)
+                return self.request_turn(1, 0)
+
+        return False
+
+    def request_turn(self, x: int, y: int) -> bool:
+        if self.__is_dead or (x, y) == (self.direction.x, self.direction.y):
+            self.__turn = None
+            return False
+
+        is_new = self.__turn != (x, y)
+
+        self.__turn = x, y
+        self.__turn_end_time = (
+            simulation_clock.get_ticks() + self.__turn_buffer_duration
+        )
+
+        return is_new
+
+    def apply_turn(self, group: pygame.sprite.Group) -> None:
+        if self.__turn is None:
+            return
+
+        if simulation_clock.get_ticks() > self.__turn_end_time:
+            self.__turn = None
+            return
 
-    def disable_sound(self) -> None:
-        self.death_sound.set_volume(0)
-        self.chomp_sound.set_volume(0)
-        self.eatfruit_sound.set_volume(0)
+        x, y = self.__turn
+        if hasattr(group, "walls") and not self.can_move(x, y, group):
+            return
 
-    def enable_sound(self) -> None:
-        self.death_sound.set_volume(1)
-        self.chomp_sound.set_volume(0.5)
-        self.eatfruit_sound.set_volume(1)
+        self.__turn = None
+        self.__turns += 1
+        self.change_direction(x, y)
@@ -1,8 +1,76 @@
+from engine.startup import startup_timer
+
+import argparse
+
 from engine.game import Game
 
+startup_timer.mark("import")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pacman")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulate games without a window, audio or frame limiter",
+    )
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-frames", type=int, default=60 * 60 * 5)
+    parser.add_argument(
+        "--script", help="input script with '<frame> <up|down|left|right>' lines"
+    )
+    parser.add_argument("--record", help="save the seed and per-frame inputs here")
+    parser.add_argument(
+        "--replay",
+        help="play a recording back, in real time or at full speed with --headless",
+    )
+    parser.add_argument(
+        "--startup-time",
+        action="store_true",
+        help="report import, init and first-flip timings, then quit",
+    )
+    parser.add_argument(
+        "--telemetry",
+        help="publish game state for spectators on host:port or a unix socket path",
+    )
+
+    args = parser.parse_args()
+
+    if args.record is not None and args.games != 1:
+        parser.error("--record needs --games 1")
+    if args.replay is not None and args.script is not None:
+        parser.error("--replay and --script are mutually exclusive")
+
+    return args
+
 
 def main() -> None:
-    game = Game()
+    args = parse_args()
+
+    if args.headless:
+        from engine.simulation import run_headless
+
+        run_headless(
+            1 if args.replay else args.games,
+            args.seed,
+            args.max_frames,
+            args.script,
+            args.record,
+            args.replay,
+        )
+        return
+
+    if args.record is not None or args.replay is not None:
+        from engine.simulation import run_realtime
+
+        run_realtime(args.seed, args.max_frames, args.record, args.replay)
+        return
+
+    if args.startup_time:
+        startup_timer.enable()
+
+    game = Game(args.telemetry)
     game.run()
 
 
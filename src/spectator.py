@@ -0,0 +1,81 @@
+import argparse
+import socket
+
+from engine.telemetry import MESSAGE, SpectatorState
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pacman spectator")
+    parser.add_argument(
+        "address", help="host:port or unix socket path passed to --telemetry"
+    )
+    parser.add_argument(
+        "--every", type=int, default=60, help="print the state every N ticks"
+    )
+
+    return parser.parse_args()
+
+
+def connect(address: str) -> socket.socket:
+    if ":" in address:
+        host, port = address.rsplit(":", 1)
+        return socket.create_connection((host, int(port)))
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(address)
+
+    return connection
+
+
+def main() -> None:
+    args = parse_args()
+
+    state = SpectatorState()
+    buffer = bytearray()
+
+    messages = 0
+    received = 0
+    skipped = 0
+    last_tick = None
+
+    with connect(args.address) as connection:
+        try:
+            while data := connection.recv(65536):
+                buffer += data
+                received += len(data)
+
+                while len(buffer) >= MESSAGE.size:
+                    (size,) = MESSAGE.unpack_from(buffer)
+                    if len(buffer) < MESSAGE.size + size:
+                        break
+
+                    snapshot = state.apply(
+                        bytes(buffer[MESSAGE.size : MESSAGE.size + size])
+                    )
+                    del buffer[: MESSAGE.size + size]
+
+                    messages += 1
+                    if last_tick is not None:
+                        skipped += snapshot.tick - last_tick - 1
+                    last_tick = snapshot.tick
+
+                    if (messages - 1) % args.every == 0:
+                        print(
+                            f"tick {snapshot.tick}: level {snapshot.level}, "
+                            f"score {snapshot.score}, health {snapshot.health}, "
+                            f"player {snapshot.player[:2]}, "
+                            f"{len(snapshot.ghosts)} ghosts, "
+                            f"{len(state.eaten)} pellets eaten"
+                        )
+        except KeyboardInterrupt:
+            pass
+
+    print(
+        f"{messages} messages, {received} bytes "
+        f"({received / max(messages, 1):.1f} bytes/message), "
+        f"{skipped} ticks dropped by the publisher"
+    )
+
+
+if __name__ == "__main__":
+    main()
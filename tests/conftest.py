@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pygame
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from engine.assets import AssetCache
+
+WALL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets/images/wall.png",
+)
+
+pytestmark = pytest.mark.usefixtures("display")
+
+
+def test_image_is_shared_until_cleared() -> None:
+    cache = AssetCache()
+
+    image = cache.image(WALL, (40, 40))
+    assert cache.image(WALL, (40, 40)) is image
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 2, "decoded": 0}
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "decoded": 0}
+    assert cache.image(WALL, (40, 40)) is not image
+
+
+def test_decoded_image_is_released_once_cached() -> None:
+    cache = AssetCache()
+
+    cache.decode(WALL)
+    assert cache.stats()["decoded"] == 1
+
+    cache.image(WALL, (40, 40))
+    assert cache.stats()["decoded"] == 0
+
+
+def test_decode_skips_images_already_cached() -> None:
+    cache = AssetCache()
+
+    cache.image(WALL)
+    cache.decode(WALL)
+
+    assert cache.stats()["decoded"] == 0
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from engine.clock import simulation_clock
+from engine.grid import TILE_SIZE
+from engine.level import Level
+from entities.ghost import PURSUIT_DURATION
+from entities.player import Player
+
+pytestmark = pytest.mark.usefixtures("display")
+
+DATA = [
+    "======",
+    "=G.P.=",
+    "=.====",
+    "=...==",
+    "======",
+]
+
+
+def place(level: Level, x: int, y: int) -> None:
+    level.player.rect.center = (
+        x * TILE_SIZE + TILE_SIZE // 2,
+        y * TILE_SIZE + TILE_SIZE // 2,
+    )
+    level.navigation.update(x, y)
+
+
+def test_ghost_follows_the_field_after_losing_sight() -> None:
+    random.seed(0)
+    simulation_clock.reset()
+
+    level = Level(1, Player(0, 0), DATA)
+    (ghost,) = level.ghosts.sprites()
+
+    place(level, 3, 1)
+    ghost.plan(level)
+    assert tuple(ghost.direction) == (1, 0)
+
+    place(level, 3, 3)
+    ghost.plan(level)
+    assert tuple(ghost.direction) == (0, 1)
+
+    simulation_clock.advance(PURSUIT_DURATION + 1)
+    ghost.change_direction(1, 0)
+    ghost.plan(level)
+    assert tuple(ghost.direction) == (1, 0)
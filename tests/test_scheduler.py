@@ -0,0 +1,80 @@
+import types
+
+import pygame
+
+from engine import scheduler
+from engine.scheduler import AIScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class Agent:
+    def __init__(self, clock: FakeClock, plan_cost: float, move_cost: float) -> None:
+        self.__clock = clock
+        self.__plan_cost = plan_cost
+        self.__move_cost = move_cost
+
+        self.plans = 0
+        self.moves = 0
+
+    def plan(self, _: pygame.sprite.Group) -> None:
+        self.__clock.now += self.__plan_cost
+        self.plans += 1
+
+    def move(self, _: pygame.sprite.Group) -> None:
+        self.__clock.now += self.__move_cost
+        self.moves += 1
+
+
+def run(monkeypatch, move_cost: float) -> list[Agent]:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        scheduler, "time", types.SimpleNamespace(perf_counter=clock.perf_counter)
+    )
+
+    agents = [Agent(clock, 100.5e-6, move_cost) for _ in range(100)]
+    AIScheduler(1000).update(agents, pygame.sprite.Group())
+
+    return agents
+
+
+def test_slow_moves_do_not_consume_the_planning_budget(monkeypatch) -> None:
+    fast = run(monkeypatch, 0.0)
+    slow = run(monkeypatch, 10e-3)
+
+    assert sum(agent.plans for agent in fast) == 10
+    assert sum(agent.plans for agent in slow) == 10
+    assert all(agent.moves == 1 for agent in slow)
+
+
+def test_planning_resumes_from_the_cursor(monkeypatch) -> None:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        scheduler, "time", types.SimpleNamespace(perf_counter=clock.perf_counter)
+    )
+
+    agents = [Agent(clock, 100.5e-6, 0.0) for _ in range(25)]
+    ai = AIScheduler(1000)
+
+    for _ in range(5):
+        ai.update(agents, pygame.sprite.Group())
+
+    assert [agent.plans for agent in agents] == [2] * 25
+
+
+def test_unbounded_budget_plans_every_agent(monkeypatch) -> None:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        scheduler, "time", types.SimpleNamespace(perf_counter=clock.perf_counter)
+    )
+
+    agents = [Agent(clock, 1.0, 1.0) for _ in range(50)]
+    AIScheduler().update(agents, pygame.sprite.Group())
+
+    assert all(agent.plans == 1 and agent.moves == 1 for agent in agents)
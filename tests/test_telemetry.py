@@ -0,0 +1,95 @@
+import random
+
+from engine.telemetry import (
+    HEADER,
+    MAX_CELLS,
+    MESSAGE,
+    Snapshot,
+    SpectatorState,
+    encode,
+)
+
+
+def body(message: bytes) -> bytes:
+    (size,) = MESSAGE.unpack_from(message)
+    assert len(message) == MESSAGE.size + size
+
+    return message[MESSAGE.size :]
+
+
+def step(rng: random.Random, snapshot: Snapshot) -> Snapshot:
+    level = snapshot.level + 1 if rng.random() < 0.01 else snapshot.level
+
+    ghosts = [
+        (
+            (x + rng.randint(-3, 3), y + rng.randint(-3, 3))
+            if rng.random() < 0.5
+            else (x, y)
+        )
+        for x, y in snapshot.ghosts
+    ]
+    if ghosts and rng.random() < 0.02:
+        del ghosts[rng.randrange(len(ghosts))]
+    if level != snapshot.level:
+        ghosts = [(rng.randint(0, 800), rng.randint(0, 800)) for _ in range(4)]
+
+    x, y, width, height = snapshot.player
+    if rng.random() < 0.7:
+        x, y = x + rng.randint(-3, 3), y + rng.randint(-3, 3)
+
+    return Snapshot(
+        snapshot.tick + 1,
+        level,
+        snapshot.score + rng.choice((0, 0, 0, 10, 50, 1000)),
+        snapshot.health - 1 if rng.random() < 0.01 else snapshot.health,
+        (x, y, width, height),
+        tuple(ghosts),
+    )
+
+
+def test_spectator_follows_deltas() -> None:
+    rng = random.Random(0)
+
+    snapshot = Snapshot(0, 1, 0, 3, (45, 45, 32, 32), ((400, 400), (440, 400)))
+    eaten: list[tuple[int, int]] = []
+
+    state = SpectatorState()
+    previous = None
+    sent = 0
+
+    for _ in range(2000):
+        snapshot = step(rng, snapshot)
+
+        reset_eaten = previous is not None and snapshot.level != previous.level
+        if reset_eaten:
+            eaten, sent = [], 0
+        for _ in range(rng.choice((0, 0, 0, 1, 2))):
+            eaten.append((rng.randint(0, 300), rng.randint(0, 300)))
+
+        cells = eaten[sent : sent + MAX_CELLS]
+        sent += len(cells)
+
+        message = encode(previous, snapshot, cells, reset_eaten)
+
+        assert state.apply(body(message)) == snapshot
+        assert state.eaten == set(eaten)
+
+        previous = snapshot
+
+
+def test_keyframe_replaces_stale_state() -> None:
+    state = SpectatorState()
+    state.apply(
+        body(encode(None, Snapshot(1, 1, 500, 3, (1, 2, 32, 32), ((5, 5),)), [(1, 1)]))
+    )
+
+    snapshot = Snapshot(9, 2, 700, 2, (3, 4, 32, 32), ((6, 6), (7, 7)))
+
+    assert state.apply(body(encode(None, snapshot, [(2, 2)]))) == snapshot
+    assert state.eaten == {(2, 2)}
+
+
+def test_unchanged_snapshot_sends_only_the_header() -> None:
+    snapshot = Snapshot(1, 1, 0, 3, (0, 0, 32, 32), ((1, 1),))
+
+    assert len(body(encode(snapshot, snapshot._replace(tick=2), []))) == HEADER.size